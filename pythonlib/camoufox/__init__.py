@@ -1,80 +1,71 @@
-from .addons import DefaultAddons
-from .async_api import AsyncCamoufox, AsyncNewBrowser
-from .consistency import (
-    ConsistencyIssue,
-    ConsistencyLevel,
-    ConsistencyReport,
-    enforce_os_consistency,
-    get_consistency_summary,
-    validate_profile,
-)
-from .presets import (
-    AVAILABLE_PRESETS,
-    get_linux_desktop_preset,
-    get_macos_apple_silicon_preset,
-    get_preset,
-    get_preset_for_os,
-    get_windows_10_preset,
-    get_windows_11_preset,
-    list_presets,
-)
-from .profile import (
-    LocaleConfig,
-    NavigatorConfig,
-    ProfileConfig,
-    ProfileStorage,
-    ProxyConfig,
-    ScreenConfig,
-    StorageConfig,
-    WebGLConfig,
-    WebRTCConfig,
-    delete_profile,
-    get_default_storage,
-    list_profiles,
-    load_profile,
-    save_profile,
-)
-from .sync_api import Camoufox, NewBrowser
-from .utils import launch_options
+"""
+Camoufox public API.
 
-__all__ = [
+Exports are loaded lazily (PEP 562): ``import camoufox`` stays cheap, and a
+submodule (and its dependencies, e.g. Playwright for the browser APIs) is only
+imported the first time one of its names is accessed.
+"""
+
+import importlib
+from typing import Any, List
+
+# Maps each public name to the submodule that defines it.
+_LAZY = {
     # Core API
-    "Camoufox",
-    "NewBrowser",
-    "AsyncCamoufox",
-    "AsyncNewBrowser",
-    "DefaultAddons",
-    "launch_options",
+    "Camoufox": "camoufox.sync_api",
+    "NewBrowser": "camoufox.sync_api",
+    "AsyncCamoufox": "camoufox.async_api",
+    "AsyncNewBrowser": "camoufox.async_api",
+    "DefaultAddons": "camoufox.addons",
+    "launch_options": "camoufox.utils",
     # Profile model
-    "ProfileConfig",
-    "ProfileStorage",
-    "NavigatorConfig",
-    "ScreenConfig",
-    "LocaleConfig",
-    "WebGLConfig",
-    "ProxyConfig",
-    "WebRTCConfig",
-    "StorageConfig",
+    "ProfileConfig": "camoufox.profile",
+    "ProfileStorage": "camoufox.profile",
+    "NavigatorConfig": "camoufox.profile",
+    "ScreenConfig": "camoufox.profile",
+    "LocaleConfig": "camoufox.profile",
+    "WebGLConfig": "camoufox.profile",
+    "ProxyConfig": "camoufox.profile",
+    "WebRTCConfig": "camoufox.profile",
+    "StorageConfig": "camoufox.profile",
+    "ProfileSummary": "camoufox.profile",
     # Profile operations
-    "save_profile",
-    "load_profile",
-    "delete_profile",
-    "list_profiles",
-    "get_default_storage",
+    "save_profile": "camoufox.profile",
+    "load_profile": "camoufox.profile",
+    "delete_profile": "camoufox.profile",
+    "list_profiles": "camoufox.profile",
+    "list_profile_summaries": "camoufox.profile",
+    "get_default_storage": "camoufox.profile",
     # Presets
-    "get_preset",
-    "get_preset_for_os",
-    "list_presets",
-    "get_macos_apple_silicon_preset",
-    "get_windows_11_preset",
-    "get_windows_10_preset",
-    "get_linux_desktop_preset",
-    "AVAILABLE_PRESETS",
+    "get_preset": "camoufox.presets",
+    "get_preset_for_os": "camoufox.presets",
+    "list_presets": "camoufox.presets",
+    "get_macos_apple_silicon_preset": "camoufox.presets",
+    "get_windows_11_preset": "camoufox.presets",
+    "get_windows_10_preset": "camoufox.presets",
+    "get_linux_desktop_preset": "camoufox.presets",
+    "AVAILABLE_PRESETS": "camoufox.presets",
     # Consistency
-    "validate_profile",
-    "enforce_os_consistency",
-    "get_consistency_summary",
-    "ConsistencyReport",
-    "ConsistencyIssue",
-    "ConsistencyLevel",
-]
+    "validate_profile": "camoufox.consistency",
+    "enforce_os_consistency": "camoufox.consistency",
+    "get_consistency_summary": "camoufox.consistency",
+    "ConsistencyReport": "camoufox.consistency",
+    "ConsistencyIssue": "camoufox.consistency",
+    "ConsistencyLevel": "camoufox.consistency",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so subsequent accesses skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(__all__) | set(globals()))
@@ -7,9 +7,21 @@ This module provides:
 - Warnings and hints for potential issues
 """
 
+import hashlib
+import operator
+import os
+import re
+import shelve
+import sys
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+from platformdirs import user_cache_dir
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
 from .profile import ProfileConfig
 
@@ -22,9 +34,34 @@ class ConsistencyLevel(Enum):
     INFO = "info"
 
 
-@dataclass
+# Severity ordering used when one field carries several issues
+_LEVEL_RANK = {
+    "error": 2,
+    "warning": 1,
+    "info": 0,
+}
+
+# Report icons keyed by severity value (plain strings hash faster than Enums)
+_LEVEL_ICONS = {
+    "error": "❌",
+    "warning": "⚠️",
+    "info": "ℹ️",
+}
+
+
+# dataclass(slots=True) needs Python 3.10+; fall back to regular dataclasses
+# on older interpreters. Slots drop the per-instance __dict__, which matters
+# when batch validation produces thousands of issues and reports.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class ConsistencyIssue:
-    """Represents a single consistency issue in a profile."""
+    """Represents a single consistency issue in a profile.
+
+    Frozen (and therefore hashable), so identical issues can be deduplicated
+    with sets across repeated validations.
+    """
     
     level: ConsistencyLevel
     code: str
@@ -43,7 +80,7 @@ class ConsistencyIssue:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ConsistencyReport:
     """Report containing all consistency issues for a profile."""
     
@@ -51,21 +88,48 @@ class ConsistencyReport:
     profile_name: str
     is_valid: bool
     issues: List[ConsistencyIssue] = field(default_factory=list)
-    
+    # Severity tally, computed lazily in one pass over issues. Reports are
+    # treated as immutable once built, so the tally is computed at most once.
+    _counts: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    # Issue codes, also memoized: callers checking "is code X present" get
+    # O(1) set membership instead of scanning the issue list.
+    _codes: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    # Rendered text, memoized per report for the same immutability reason.
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def _tally(self) -> Dict[str, int]:
+        """Count issues per severity level in a single pass (memoized)."""
+        counts = self._counts
+        if counts is None:
+            counts = {"error": 0, "warning": 0, "info": 0}
+            for i in self.issues:
+                counts[i.level.value] += 1
+            self._counts = counts
+        return counts
+
+    @property
+    def codes(self) -> FrozenSet[str]:
+        """Set of issue codes present in this report."""
+        codes = self._codes
+        if codes is None:
+            codes = frozenset(i.code for i in self.issues)
+            self._codes = codes
+        return codes
+
     @property
     def error_count(self) -> int:
         """Count of error-level issues."""
-        return sum(1 for i in self.issues if i.level == ConsistencyLevel.ERROR)
-    
+        return self._tally()["error"]
+
     @property
     def warning_count(self) -> int:
         """Count of warning-level issues."""
-        return sum(1 for i in self.issues if i.level == ConsistencyLevel.WARNING)
-    
+        return self._tally()["warning"]
+
     @property
     def info_count(self) -> int:
         """Count of info-level issues."""
-        return sum(1 for i in self.issues if i.level == ConsistencyLevel.INFO)
+        return self._tally()["info"]
     
     def has_errors(self) -> bool:
         """Check if report has any errors."""
@@ -88,73 +152,111 @@ class ConsistencyReport:
         }
     
     def format_human_readable(self) -> str:
-        """Format report as human-readable text."""
-        lines = [
-            f"Consistency Report for: {self.profile_name}",
-            f"Profile ID: {self.profile_id}",
-            f"Status: {'VALID' if self.is_valid else 'INVALID'}",
-            f"Issues: {self.error_count} errors, {self.warning_count} warnings, {self.info_count} info",
-            "",
-        ]
-        
-        if not self.issues:
-            lines.append("No issues found. Profile is internally consistent.")
+        """Format report as human-readable text (rendered at most once)."""
+        if self._text is not None:
+            return self._text
+        issues = self.issues
+        # Preallocate: 5 header lines plus at most 4 lines per issue
+        lines = [""] * (5 + max(len(issues) * 4, 1))
+        lines[0] = f"Consistency Report for: {self.profile_name}"
+        lines[1] = f"Profile ID: {self.profile_id}"
+        lines[2] = f"Status: {'VALID' if self.is_valid else 'INVALID'}"
+        lines[3] = f"Issues: {self.error_count} errors, {self.warning_count} warnings, {self.info_count} info"
+        idx = 5
+
+        if not issues:
+            lines[idx] = "No issues found. Profile is internally consistent."
+            idx += 1
         else:
-            for issue in self.issues:
-                icon = {
-                    ConsistencyLevel.ERROR: "❌",
-                    ConsistencyLevel.WARNING: "⚠️",
-                    ConsistencyLevel.INFO: "ℹ️",
-                }[issue.level]
-                lines.append(f"{icon} [{issue.code}] {issue.message}")
-                lines.append(f"   Field: {issue.field}")
+            for issue in issues:
+                icon = _LEVEL_ICONS[issue.level.value]
+                lines[idx] = f"{icon} [{issue.code}] {issue.message}"
+                lines[idx + 1] = f"   Field: {issue.field}"
+                idx += 2
                 if issue.suggestion:
-                    lines.append(f"   Suggestion: {issue.suggestion}")
-                lines.append("")
-        
-        return "\n".join(lines)
+                    lines[idx] = f"   Suggestion: {issue.suggestion}"
+                    idx += 1
+                # Blank separator after each issue (already "")
+                idx += 1
+
+        self._text = "\n".join(lines[:idx])
+        return self._text
 
 
 # ============================================================================
 # OS-specific expected values
 # ============================================================================
 
-OS_PLATFORM_MAP = {
-    "macos": ["MacIntel", "MacPPC", "Mac68K"],
-    "windows": ["Win32", "Win64"],
-    "linux": ["Linux x86_64", "Linux i686", "Linux armv7l", "Linux aarch64"],
-}
+# All maps are frozen: immutable tuples behind read-only mapping proxies,
+# so lookups never hand out mutable state and misses share one sentinel.
+OS_PLATFORM_MAP = MappingProxyType({
+    "macos": ("MacIntel", "MacPPC", "Mac68K"),
+    "windows": ("Win32", "Win64"),
+    "linux": ("Linux x86_64", "Linux i686", "Linux armv7l", "Linux aarch64"),
+})
 
-OS_OSCPU_PATTERNS = {
-    "macos": ["Intel Mac OS X", "Mac OS X"],
-    "windows": ["Windows NT"],
-    "linux": ["Linux"],
-}
+OS_OSCPU_PATTERNS = MappingProxyType({
+    "macos": ("Intel Mac OS X", "Mac OS X"),
+    "windows": ("Windows NT",),
+    "linux": ("Linux",),
+})
 
-OS_UA_PATTERNS = {
-    "macos": ["Macintosh", "Mac OS X"],
-    "windows": ["Windows NT"],
-    "linux": ["Linux", "X11"],
-}
+OS_UA_PATTERNS = MappingProxyType({
+    "macos": ("Macintosh", "Mac OS X"),
+    "windows": ("Windows NT",),
+    "linux": ("Linux", "X11"),
+})
 
 # Timezone regions typically associated with each locale region
-REGION_TIMEZONE_MAP = {
-    "US": ["America/"],
-    "GB": ["Europe/London"],
-    "DE": ["Europe/Berlin"],
-    "FR": ["Europe/Paris"],
-    "JP": ["Asia/Tokyo"],
-    "CN": ["Asia/Shanghai", "Asia/Beijing"],
-    "AU": ["Australia/"],
-    "BR": ["America/Sao_Paulo"],
-    "CA": ["America/Toronto", "America/Vancouver"],
-}
+REGION_TIMEZONE_MAP = MappingProxyType({
+    "US": ("America/",),
+    "GB": ("Europe/London",),
+    "DE": ("Europe/Berlin",),
+    "FR": ("Europe/Paris",),
+    "JP": ("Asia/Tokyo",),
+    "CN": ("Asia/Shanghai", "Asia/Beijing"),
+    "AU": ("Australia/",),
+    "BR": ("America/Sao_Paulo",),
+    "CA": ("America/Toronto", "America/Vancouver"),
+})
 
 # Common device pixel ratios for each OS
-OS_DPR_RANGES = {
-    "macos": [(1.0, 1.0), (2.0, 2.0)],  # Standard or Retina
-    "windows": [(1.0, 2.0)],  # 100% to 200% scaling
-    "linux": [(1.0, 2.0)],
+OS_DPR_RANGES = MappingProxyType({
+    "macos": ((1.0, 1.0), (2.0, 2.0)),  # Standard or Retina
+    "windows": ((1.0, 2.0),),  # 100% to 200% scaling
+    "linux": ((1.0, 2.0),),
+})
+
+# Precompiled lookups derived from the maps above, built once at import time.
+# Platform matching is exact, so a frozenset gives O(1) membership; the
+# oscpu/UA substring scans collapse to a single compiled alternation each.
+_OS_PLATFORM_SETS = {os_: frozenset(v) for os_, v in OS_PLATFORM_MAP.items()}
+_OS_OSCPU_RE = {
+    os_: re.compile("|".join(map(re.escape, v)))
+    for os_, v in OS_OSCPU_PATTERNS.items()
+}
+_OS_UA_RE = {
+    os_: re.compile("|".join(map(re.escape, v)))
+    for os_, v in OS_UA_PATTERNS.items()
+}
+_EMPTY_SET: frozenset = frozenset()
+
+# Suggestion strings are constant per OS/region; join them once at import so
+# failing checks copy a pointer instead of re-running str.join per call.
+_PLATFORM_SUGGESTIONS = {
+    os_: f"Use one of: {', '.join(v)}" for os_, v in OS_PLATFORM_MAP.items()
+}
+_OSCPU_SUGGESTIONS = {
+    os_: f"oscpu should contain one of: {', '.join(v)}"
+    for os_, v in OS_OSCPU_PATTERNS.items()
+}
+_UA_SUGGESTIONS = {
+    os_: f"User-Agent should contain one of: {', '.join(v)}"
+    for os_, v in OS_UA_PATTERNS.items()
+}
+_TIMEZONE_SUGGESTIONS = {
+    region: f"Consider using a timezone starting with: {', '.join(v)}"
+    for region, v in REGION_TIMEZONE_MAP.items()
 }
 
 
@@ -162,260 +264,596 @@ OS_DPR_RANGES = {
 # Consistency checks
 # ============================================================================
 
+# Fixed issue codes and field names, interned so that dict lookups keyed on
+# them (e.g. field_status in get_consistency_summary) hit the pointer-equality
+# fast path before falling back to a character compare.
+_CODES = {
+    name: sys.intern(name)
+    for name in (
+        "OS_PLATFORM_MISMATCH",
+        "OS_OSCPU_MISMATCH",
+        "OS_UA_MISMATCH",
+        "TIMEZONE_REGION_MISMATCH",
+        "WEBGL_OS_MISMATCH",
+        "WEBRTC_PROXY_LEAK",
+        "MACOS_DPR_UNUSUAL",
+        "WINDOWS_DPR_UNUSUAL",
+        "MACOS_TOUCH_UNUSUAL",
+        "COLOR_DEPTH_UNUSUAL",
+        "INVALID_CORE_COUNT",
+        "HIGH_CORE_COUNT",
+        "SMALL_SCREEN",
+        "INVALID_AVAIL_DIMENSIONS",
+    )
+}
+_FIELDS = {
+    name: sys.intern(name)
+    for name in (
+        "navigator.platform",
+        "navigator.oscpu",
+        "navigator.user_agent",
+        "navigator.hardware_concurrency",
+        "navigator.max_touch_points",
+        "locale.timezone",
+        "webgl.renderer",
+        "webrtc.mode",
+        "screen.device_pixel_ratio",
+        "screen.color_depth",
+        "screen.width/height",
+        "screen.availWidth/availHeight",
+    )
+}
+
+
+# C-level multi-attribute extraction: one call pulls all four screen
+# dimensions into a tuple instead of four LOAD_ATTR round trips.
+_SCREEN_DIMS = operator.attrgetter("width", "height", "avail_width", "avail_height")
+
+
 def check_os_platform_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check if navigator.platform matches target OS."""
-    expected_platforms = OS_PLATFORM_MAP.get(profile.target_os, [])
-    actual_platform = profile.navigator.platform
-    
-    if actual_platform and actual_platform not in expected_platforms:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.ERROR,
-            code="OS_PLATFORM_MISMATCH",
-            message=f"Platform '{actual_platform}' does not match target OS '{profile.target_os}'",
-            field="navigator.platform",
-            suggestion=f"Use one of: {', '.join(expected_platforms)}",
-        )
-    return None
+    platform = profile.navigator.platform
+    if not platform:
+        return None
+    if platform in _OS_PLATFORM_SETS.get(profile.target_os, _EMPTY_SET):
+        return None
+    return _platform_issue(profile.target_os, platform)
 
 
 def check_os_oscpu_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check if navigator.oscpu matches target OS."""
-    expected_patterns = OS_OSCPU_PATTERNS.get(profile.target_os, [])
-    actual_oscpu = profile.navigator.oscpu
-    
-    if actual_oscpu:
-        matches = any(pattern in actual_oscpu for pattern in expected_patterns)
-        if not matches:
-            return ConsistencyIssue(
-                level=ConsistencyLevel.ERROR,
-                code="OS_OSCPU_MISMATCH",
-                message=f"oscpu '{actual_oscpu}' does not match target OS '{profile.target_os}'",
-                field="navigator.oscpu",
-                suggestion=f"oscpu should contain one of: {', '.join(expected_patterns)}",
-            )
-    return None
+    oscpu = profile.navigator.oscpu
+    if not oscpu:
+        return None
+    regex = _OS_OSCPU_RE.get(profile.target_os)
+    if regex is not None and regex.search(oscpu):
+        return None
+    return _oscpu_issue(profile.target_os, oscpu)
 
 
 def check_os_useragent_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check if User-Agent matches target OS."""
-    expected_patterns = OS_UA_PATTERNS.get(profile.target_os, [])
-    actual_ua = profile.navigator.user_agent
-    
-    if actual_ua:
-        matches = any(pattern in actual_ua for pattern in expected_patterns)
-        if not matches:
-            return ConsistencyIssue(
-                level=ConsistencyLevel.ERROR,
-                code="OS_UA_MISMATCH",
-                message=f"User-Agent does not contain expected patterns for '{profile.target_os}'",
-                field="navigator.user_agent",
-                suggestion=f"User-Agent should contain one of: {', '.join(expected_patterns)}",
-            )
-    return None
+    ua = profile.navigator.user_agent
+    if not ua:
+        return None
+    regex = _OS_UA_RE.get(profile.target_os)
+    if regex is not None and regex.search(ua):
+        return None
+    return _ua_issue(profile.target_os)
 
 
 def check_timezone_locale_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check if timezone reasonably matches locale region."""
-    region = profile.locale.region
-    timezone = profile.locale.timezone
-    
+    loc = profile.locale
+    region = loc.region
+    timezone = loc.timezone
     expected_prefixes = REGION_TIMEZONE_MAP.get(region)
-    
-    if expected_prefixes and timezone:
-        matches = any(timezone.startswith(prefix) for prefix in expected_prefixes)
-        if not matches:
-            return ConsistencyIssue(
-                level=ConsistencyLevel.WARNING,
-                code="TIMEZONE_REGION_MISMATCH",
-                message=f"Timezone '{timezone}' may not match region '{region}'",
-                field="locale.timezone",
-                suggestion=f"Consider using a timezone starting with: {', '.join(expected_prefixes)}",
-            )
-    return None
+    if not expected_prefixes or not timezone:
+        return None
+    if any(timezone.startswith(prefix) for prefix in expected_prefixes):
+        return None
+    return _timezone_issue(region, timezone)
 
 
 def check_screen_dpr_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check if device pixel ratio is reasonable for target OS."""
     target_os = profile.target_os
     dpr = profile.screen.device_pixel_ratio
-    
+
     # macOS specific check for Retina
-    if target_os == "macos" and dpr not in [1.0, 2.0]:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.WARNING,
-            code="MACOS_DPR_UNUSUAL",
-            message=f"Device pixel ratio {dpr} is unusual for macOS",
-            field="screen.device_pixel_ratio",
-            suggestion="macOS typically uses 1.0 (standard) or 2.0 (Retina)",
-        )
-    
+    if target_os == "macos" and dpr not in (1.0, 2.0):
+        return _macos_dpr_issue(dpr)
+
     # Windows specific check
-    if target_os == "windows" and dpr not in [1.0, 1.25, 1.5, 1.75, 2.0]:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.INFO,
-            code="WINDOWS_DPR_UNUSUAL",
-            message=f"Device pixel ratio {dpr} is unusual for Windows",
-            field="screen.device_pixel_ratio",
-            suggestion="Windows typically uses 1.0, 1.25, 1.5, 1.75, or 2.0",
-        )
-    
+    if target_os == "windows" and dpr not in (1.0, 1.25, 1.5, 1.75, 2.0):
+        return _windows_dpr_issue(dpr)
+
     return None
 
 
-def check_webgl_os_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
-    """Check if WebGL vendor/renderer is consistent with target OS."""
-    if not profile.webgl.enabled:
-        return None
-    
-    vendor = profile.webgl.vendor.lower()
-    renderer = profile.webgl.renderer.lower()
-    target_os = profile.target_os
-    
+# Single-pass tokenizer for WebGL renderer strings. One case-insensitive
+# scan replaces the repeated .lower() + substring probes per check.
+_WEBGL_TOKEN_RE = re.compile(r"direct3d|d3d", re.IGNORECASE)
+_ANGLE_RE = re.compile(r"angle", re.IGNORECASE)
+_GOOGLE_VENDOR_RE = re.compile(r"google inc", re.IGNORECASE)
+_APPLE_PREFIX_RE = re.compile(r"apple", re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _webgl_os_issue(target_os: str, vendor: str, renderer: str) -> Optional[ConsistencyIssue]:
+    """
+    Classify a (target_os, vendor, renderer) triple into an issue or None.
+
+    Memoized: presets reuse identical GPU strings across many profiles,
+    so repeated validations hit the cache instead of re-scanning.
+    """
     # Check for obvious mismatches using more specific patterns
     # Direct3D is Windows-specific, ANGLE is typically used with Direct3D on Windows
+    has_direct3d = _WEBGL_TOKEN_RE.search(renderer) is not None
+
     if target_os == "macos":
-        # Check for Direct3D which is Windows-specific
-        has_direct3d = "direct3d" in renderer or "d3d" in renderer
         # ANGLE in vendor suggests Windows (ANGLE wraps Direct3D)
-        has_angle_vendor = vendor.startswith("google inc") and "angle" in renderer
+        has_angle_vendor = (
+            _GOOGLE_VENDOR_RE.match(vendor) is not None
+            and _ANGLE_RE.search(renderer) is not None
+        )
         if has_direct3d or has_angle_vendor:
             return ConsistencyIssue(
                 level=ConsistencyLevel.ERROR,
-                code="WEBGL_OS_MISMATCH",
+                code=_CODES["WEBGL_OS_MISMATCH"],
                 message="Direct3D/ANGLE renderer detected with macOS target",
-                field="webgl.renderer",
+                field=_FIELDS["webgl.renderer"],
                 suggestion="macOS typically uses Apple GPU or OpenGL renderers",
             )
-    
-    if target_os == "windows":
-        # Check for Apple GPU which is macOS-specific
-        is_apple_vendor = vendor.startswith("apple")
-        is_apple_renderer = renderer.startswith("apple")
-        if is_apple_vendor and is_apple_renderer:
+
+    elif target_os == "windows":
+        # Apple GPU is macOS-specific
+        if _APPLE_PREFIX_RE.match(vendor) and _APPLE_PREFIX_RE.match(renderer):
             return ConsistencyIssue(
                 level=ConsistencyLevel.ERROR,
-                code="WEBGL_OS_MISMATCH",
+                code=_CODES["WEBGL_OS_MISMATCH"],
                 message="Apple renderer detected with Windows target",
-                field="webgl.renderer",
+                field=_FIELDS["webgl.renderer"],
                 suggestion="Windows typically uses ANGLE (Direct3D) or native GPU renderers",
             )
-    
-    if target_os == "linux":
-        # Direct3D is Windows-specific
-        has_direct3d = "direct3d" in renderer or "d3d" in renderer
+
+    elif target_os == "linux":
         if has_direct3d:
             return ConsistencyIssue(
                 level=ConsistencyLevel.ERROR,
-                code="WEBGL_OS_MISMATCH",
+                code=_CODES["WEBGL_OS_MISMATCH"],
                 message="Direct3D renderer detected with Linux target",
-                field="webgl.renderer",
+                field=_FIELDS["webgl.renderer"],
                 suggestion="Linux typically uses Mesa or native OpenGL renderers",
             )
-    
+
     return None
 
 
+def check_webgl_os_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
+    """Check if WebGL vendor/renderer is consistent with target OS."""
+    webgl = profile.webgl
+    if not webgl.enabled:
+        return None
+
+    return _webgl_os_issue(profile.target_os, webgl.vendor, webgl.renderer)
+
+
 def check_touch_macos_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check touch points for macOS (should typically be 0)."""
-    if profile.target_os == "macos" and profile.navigator.max_touch_points > 0:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.WARNING,
-            code="MACOS_TOUCH_UNUSUAL",
-            message=f"maxTouchPoints={profile.navigator.max_touch_points} is unusual for macOS",
-            field="navigator.max_touch_points",
-            suggestion="macOS devices typically report 0 touch points",
-        )
+    touch_points = profile.navigator.max_touch_points
+    if profile.target_os == "macos" and touch_points > 0:
+        return _macos_touch_issue(touch_points)
     return None
 
 
 def check_webrtc_proxy_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check WebRTC configuration with proxy settings."""
-    has_proxy = profile.proxy.type != "none" and profile.proxy.server
-    webrtc_mode = profile.webrtc.mode
-    
-    if has_proxy and webrtc_mode == "default":
-        return ConsistencyIssue(
-            level=ConsistencyLevel.WARNING,
-            code="WEBRTC_PROXY_LEAK",
-            message="WebRTC is enabled with proxy but mode is 'default'",
-            field="webrtc.mode",
-            suggestion="Consider setting webrtc.mode to 'disabled' or 'proxy_only' to prevent IP leaks",
-        )
+    proxy = profile.proxy
+    has_proxy = proxy.type != "none" and proxy.server
+
+    if has_proxy and profile.webrtc.mode == "default":
+        return _webrtc_proxy_issue()
     return None
 
 
 def check_color_depth_consistency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check color depth is reasonable."""
     color_depth = profile.screen.color_depth
-    
-    if color_depth not in [24, 30, 32]:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.INFO,
-            code="COLOR_DEPTH_UNUSUAL",
-            message=f"Color depth {color_depth} is unusual",
-            field="screen.color_depth",
-            suggestion="Common values are 24, 30, or 32 bits",
-        )
-    return None
+    if color_depth in (24, 30, 32):
+        return None
+    return _color_depth_issue(color_depth)
 
 
 def check_hardware_concurrency(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check hardware concurrency is reasonable."""
     cores = profile.navigator.hardware_concurrency
-    
     if cores < 1:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.ERROR,
-            code="INVALID_CORE_COUNT",
-            message="Hardware concurrency must be at least 1",
-            field="navigator.hardware_concurrency",
-            suggestion="Set to a value between 2 and 16",
-        )
-    
+        return _invalid_cores_issue()
     if cores > 64:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.WARNING,
-            code="HIGH_CORE_COUNT",
-            message=f"Hardware concurrency {cores} is unusually high",
-            field="navigator.hardware_concurrency",
-            suggestion="Most consumer devices have 2-16 cores",
-        )
-    
+        return _high_cores_issue(cores)
     return None
 
 
 def check_screen_dimensions(profile: ProfileConfig) -> Optional[ConsistencyIssue]:
     """Check screen dimensions are reasonable."""
-    width = profile.screen.width
-    height = profile.screen.height
-    avail_width = profile.screen.avail_width
-    avail_height = profile.screen.avail_height
-    
+    width, height, avail_width, avail_height = _SCREEN_DIMS(profile.screen)
     if width < 800 or height < 600:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.WARNING,
-            code="SMALL_SCREEN",
-            message=f"Screen resolution {width}x{height} is very small",
-            field="screen.width/height",
-            suggestion="Most desktop browsers use at least 1280x720",
-        )
-    
+        return _small_screen_issue(width, height)
     if avail_width > width or avail_height > height:
-        return ConsistencyIssue(
-            level=ConsistencyLevel.ERROR,
-            code="INVALID_AVAIL_DIMENSIONS",
-            message="Available dimensions exceed total screen dimensions",
-            field="screen.availWidth/availHeight",
-            suggestion="Available dimensions must be less than or equal to total dimensions",
-        )
-    
+        return _invalid_avail_issue()
     return None
 
 
+# Issue factories. The check predicates above and the fused pass below only
+# call these on the failure path, so a clean profile allocates nothing.
+
+def _platform_issue(target_os: str, platform: str) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.ERROR,
+        code=_CODES["OS_PLATFORM_MISMATCH"],
+        message=f"Platform '{platform}' does not match target OS '{target_os}'",
+        field=_FIELDS["navigator.platform"],
+        suggestion=_PLATFORM_SUGGESTIONS.get(target_os, ""),
+    )
+
+
+def _oscpu_issue(target_os: str, oscpu: str) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.ERROR,
+        code=_CODES["OS_OSCPU_MISMATCH"],
+        message=f"oscpu '{oscpu}' does not match target OS '{target_os}'",
+        field=_FIELDS["navigator.oscpu"],
+        suggestion=_OSCPU_SUGGESTIONS.get(target_os, ""),
+    )
+
+
+def _ua_issue(target_os: str) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.ERROR,
+        code=_CODES["OS_UA_MISMATCH"],
+        message=f"User-Agent does not contain expected patterns for '{target_os}'",
+        field=_FIELDS["navigator.user_agent"],
+        suggestion=_UA_SUGGESTIONS.get(target_os, ""),
+    )
+
+
+def _timezone_issue(region: str, timezone: str) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["TIMEZONE_REGION_MISMATCH"],
+        message=f"Timezone '{timezone}' may not match region '{region}'",
+        field=_FIELDS["locale.timezone"],
+        suggestion=_TIMEZONE_SUGGESTIONS[region],
+    )
+
+
+def _webrtc_proxy_issue() -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["WEBRTC_PROXY_LEAK"],
+        message="WebRTC is enabled with proxy but mode is 'default'",
+        field=_FIELDS["webrtc.mode"],
+        suggestion="Consider setting webrtc.mode to 'disabled' or 'proxy_only' to prevent IP leaks",
+    )
+
+
+def _macos_dpr_issue(dpr: float) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["MACOS_DPR_UNUSUAL"],
+        message=f"Device pixel ratio {dpr} is unusual for macOS",
+        field=_FIELDS["screen.device_pixel_ratio"],
+        suggestion="macOS typically uses 1.0 (standard) or 2.0 (Retina)",
+    )
+
+
+def _windows_dpr_issue(dpr: float) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.INFO,
+        code=_CODES["WINDOWS_DPR_UNUSUAL"],
+        message=f"Device pixel ratio {dpr} is unusual for Windows",
+        field=_FIELDS["screen.device_pixel_ratio"],
+        suggestion="Windows typically uses 1.0, 1.25, 1.5, 1.75, or 2.0",
+    )
+
+
+def _macos_touch_issue(touch_points: int) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["MACOS_TOUCH_UNUSUAL"],
+        message=f"maxTouchPoints={touch_points} is unusual for macOS",
+        field=_FIELDS["navigator.max_touch_points"],
+        suggestion="macOS devices typically report 0 touch points",
+    )
+
+
+def _color_depth_issue(color_depth: int) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.INFO,
+        code=_CODES["COLOR_DEPTH_UNUSUAL"],
+        message=f"Color depth {color_depth} is unusual",
+        field=_FIELDS["screen.color_depth"],
+        suggestion="Common values are 24, 30, or 32 bits",
+    )
+
+
+def _invalid_cores_issue() -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.ERROR,
+        code=_CODES["INVALID_CORE_COUNT"],
+        message="Hardware concurrency must be at least 1",
+        field=_FIELDS["navigator.hardware_concurrency"],
+        suggestion="Set to a value between 2 and 16",
+    )
+
+
+def _high_cores_issue(cores: int) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["HIGH_CORE_COUNT"],
+        message=f"Hardware concurrency {cores} is unusually high",
+        field=_FIELDS["navigator.hardware_concurrency"],
+        suggestion="Most consumer devices have 2-16 cores",
+    )
+
+
+def _small_screen_issue(width: int, height: int) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.WARNING,
+        code=_CODES["SMALL_SCREEN"],
+        message=f"Screen resolution {width}x{height} is very small",
+        field=_FIELDS["screen.width/height"],
+        suggestion="Most desktop browsers use at least 1280x720",
+    )
+
+
+def _invalid_avail_issue() -> ConsistencyIssue:
+    return ConsistencyIssue(
+        level=ConsistencyLevel.ERROR,
+        code=_CODES["INVALID_AVAIL_DIMENSIONS"],
+        message="Available dimensions exceed total screen dimensions",
+        field=_FIELDS["screen.availWidth/availHeight"],
+        suggestion="Available dimensions must be less than or equal to total dimensions",
+    )
+
+
+def _run_all_checks(profile: ProfileConfig) -> List[ConsistencyIssue]:
+    """
+    Run every consistency check in a single fused pass.
+
+    Equivalent to calling each check_* helper in order, but binds the
+    sub-configs to locals once and runs straight-line comparisons, avoiding
+    eleven function calls and repeated attribute chains per validation.
+    The individual check_* helpers remain available for external callers.
+    """
+    os_ = profile.target_os
+    nav = profile.navigator
+    scr = profile.screen
+    loc = profile.locale
+    webgl = profile.webgl
+    proxy = profile.proxy
+    webrtc = profile.webrtc
+    issues: List[ConsistencyIssue] = []
+
+    # OS / platform
+    platform = nav.platform
+    if platform and platform not in _OS_PLATFORM_SETS.get(os_, _EMPTY_SET):
+        issues.append(_platform_issue(os_, platform))
+
+    # OS / oscpu
+    oscpu = nav.oscpu
+    if oscpu:
+        regex = _OS_OSCPU_RE.get(os_)
+        if regex is None or not regex.search(oscpu):
+            issues.append(_oscpu_issue(os_, oscpu))
+
+    # OS / User-Agent
+    ua = nav.user_agent
+    if ua:
+        regex = _OS_UA_RE.get(os_)
+        if regex is None or not regex.search(ua):
+            issues.append(_ua_issue(os_))
+
+    # Timezone / locale region
+    timezone = loc.timezone
+    expected_prefixes = REGION_TIMEZONE_MAP.get(loc.region)
+    if expected_prefixes and timezone:
+        if not any(timezone.startswith(prefix) for prefix in expected_prefixes):
+            issues.append(_timezone_issue(loc.region, timezone))
+
+    # Device pixel ratio
+    dpr = scr.device_pixel_ratio
+    if os_ == "macos" and dpr not in [1.0, 2.0]:
+        issues.append(_macos_dpr_issue(dpr))
+    elif os_ == "windows" and dpr not in [1.0, 1.25, 1.5, 1.75, 2.0]:
+        issues.append(_windows_dpr_issue(dpr))
+
+    # WebGL / OS
+    issue = check_webgl_os_consistency(profile)
+    if issue:
+        issues.append(issue)
+
+    # Touch points on macOS
+    if os_ == "macos" and nav.max_touch_points > 0:
+        issues.append(_macos_touch_issue(nav.max_touch_points))
+
+    # WebRTC / proxy
+    if proxy.type != "none" and proxy.server and webrtc.mode == "default":
+        issues.append(_webrtc_proxy_issue())
+
+    # Color depth
+    color_depth = scr.color_depth
+    if color_depth not in [24, 30, 32]:
+        issues.append(_color_depth_issue(color_depth))
+
+    # Hardware concurrency
+    cores = nav.hardware_concurrency
+    if cores < 1:
+        issues.append(_invalid_cores_issue())
+    elif cores > 64:
+        issues.append(_high_cores_issue(cores))
+
+    # Screen dimensions
+    width, height, avail_width, avail_height = _SCREEN_DIMS(scr)
+    if width < 800 or height < 600:
+        issues.append(_small_screen_issue(width, height))
+    elif avail_width > width or avail_height > height:
+        issues.append(_invalid_avail_issue())
+
+    return issues
+
+
 # ============================================================================
 # Main validation function
 # ============================================================================
 
+# LRU cache of validation results keyed by profile content signature.
+# Repeated validations of unchanged profiles (e.g. UI refreshes) are O(1).
+def _cache_maxsize() -> int:
+    try:
+        return max(int(os.environ.get("CAMOUFOX_VALIDATION_CACHE_SIZE", "256")), 1)
+    except ValueError:
+        return 256
+
+
+_VALIDATION_CACHE_MAXSIZE = _cache_maxsize()
+_VALIDATION_CACHE: "OrderedDict[str, ConsistencyReport]" = OrderedDict()
+
+# Second cache tier: a small shelve database in the user cache dir, so
+# repeated CLI invocations and container launches skip re-validating
+# unchanged profiles entirely. Keys embed the package version — or, when the
+# package isn't pip-installed (e.g. run straight from the repo via sys.path),
+# a hash of this module's source — so upgrades and code edits both invalidate
+# stale entries. The tier honours CAMOUFOX_VALIDATION_CACHE_SIZE with LRU
+# eviction and can be disabled outright via CAMOUFOX_VALIDATION_DISK_CACHE=0
+# (the test suite does this to stay hermetic). The disk tier is an
+# optimization and never a requirement: every disk error is swallowed
+# silently.
+try:
+    from importlib.metadata import version as _pkg_version
+
+    _MODULE_VERSION: Optional[str] = _pkg_version("camoufox")
+except Exception:
+    try:
+        with open(__file__, "rb") as _src:
+            _MODULE_VERSION = "src-" + hashlib.blake2b(_src.read(), digest_size=8).hexdigest()
+    except OSError:
+        # No version and no readable source: provenance unknown, so cached
+        # reports could never be invalidated — keep the disk tier off.
+        _MODULE_VERSION = None
+
+_DISK_CACHE_PATH = os.path.join(user_cache_dir("camoufox"), "validation_cache")
+# Recency list stored inside the shelf itself, oldest key first.
+_DISK_ORDER_KEY = "__lru_order__"
+_DISK_CACHE: Optional["shelve.Shelf"] = None
+_DISK_CACHE_FAILED = False
+
+
+def _disk_cache() -> Optional["shelve.Shelf"]:
+    """Lazily open the on-disk cache, or None if it is unavailable."""
+    global _DISK_CACHE, _DISK_CACHE_FAILED
+    if _DISK_CACHE is None and not _DISK_CACHE_FAILED:
+        enabled = os.environ.get("CAMOUFOX_VALIDATION_DISK_CACHE", "1").lower()
+        if _MODULE_VERSION is None or enabled in ("0", "false", "off"):
+            _DISK_CACHE_FAILED = True
+            return None
+        try:
+            os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+            _DISK_CACHE = shelve.open(_DISK_CACHE_PATH)
+        except Exception:
+            _DISK_CACHE_FAILED = True
+    return _DISK_CACHE
+
+
+def _disk_cache_get(signature: str) -> Optional[ConsistencyReport]:
+    db = _disk_cache()
+    if db is None:
+        return None
+    try:
+        key = f"{_MODULE_VERSION}:{signature}"
+        report = db.get(key)
+        if report is not None:
+            order = db.get(_DISK_ORDER_KEY)
+            if order and order[-1] != key and key in order:
+                order.remove(key)
+                order.append(key)
+                db[_DISK_ORDER_KEY] = order
+        return report
+    except Exception:
+        return None
+
+
+def _disk_cache_put(signature: str, report: ConsistencyReport) -> None:
+    db = _disk_cache()
+    if db is None:
+        return
+    try:
+        key = f"{_MODULE_VERSION}:{signature}"
+        db[key] = report
+        order = db.get(_DISK_ORDER_KEY, [])
+        if key in order:
+            order.remove(key)
+        order.append(key)
+        # Same bound as the in-memory tier, evicting least recently used
+        while len(order) > _VALIDATION_CACHE_MAXSIZE:
+            stale = order.pop(0)
+            try:
+                del db[stale]
+            except KeyError:
+                pass
+        db[_DISK_ORDER_KEY] = order
+    except Exception:
+        pass
+
+
+def _profile_signature(profile: ProfileConfig) -> str:
+    """
+    Compute a stable content hash of the fields validation depends on.
+
+    Two profiles with identical fingerprint-relevant fields share the same
+    signature regardless of id/name/timestamps.
+    """
+    nav = profile.navigator
+    scr = profile.screen
+    loc = profile.locale
+    webgl = profile.webgl
+    key = (
+        profile.target_os,
+        nav.platform,
+        nav.oscpu,
+        nav.user_agent,
+        nav.hardware_concurrency,
+        nav.max_touch_points,
+        loc.region,
+        loc.timezone,
+        scr.device_pixel_ratio,
+        scr.color_depth,
+        scr.width,
+        scr.height,
+        scr.avail_width,
+        scr.avail_height,
+        webgl.enabled,
+        webgl.vendor,
+        webgl.renderer,
+        profile.webrtc.mode,
+        profile.proxy.type,
+        bool(profile.proxy.server),
+    )
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def clear_validation_cache() -> None:
+    """Clear the cached validation results, both in-process and on disk."""
+    _VALIDATION_CACHE.clear()
+    db = _disk_cache()
+    if db is not None:
+        try:
+            db.clear()
+        except Exception:
+            pass
+
+
 def validate_profile(profile: ProfileConfig) -> ConsistencyReport:
     """
     Validate a profile for internal consistency.
@@ -434,80 +872,293 @@ def validate_profile(profile: ProfileConfig) -> ConsistencyReport:
         >>> if report.has_errors():
         ...     print(report.format_human_readable())
     """
+    signature = _profile_signature(profile)
+    cached = _VALIDATION_CACHE.get(signature)
+    if cached is not None:
+        _VALIDATION_CACHE.move_to_end(signature)
+    else:
+        cached = _disk_cache_get(signature)
+        if cached is not None:
+            # Promote the disk hit into the in-process LRU.
+            _VALIDATION_CACHE[signature] = cached
+            if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+                _VALIDATION_CACHE.popitem(last=False)
+    if cached is not None:
+        if cached.profile_id != profile.id or cached.profile_name != profile.name:
+            # Same fingerprint content, different identity: re-key the report.
+            cached = ConsistencyReport(
+                profile_id=profile.id,
+                profile_name=profile.name,
+                is_valid=cached.is_valid,
+                issues=cached.issues,
+            )
+        return cached
+
+    # Run all checks in one fused pass
+    issues = _run_all_checks(profile)
+
+    # Profile is valid if there are no errors
+    is_valid = not any(i.level is ConsistencyLevel.ERROR for i in issues)
+
+    report = ConsistencyReport(
+        profile_id=profile.id,
+        profile_name=profile.name,
+        is_valid=is_valid,
+        issues=issues,
+    )
+
+    _VALIDATION_CACHE[signature] = report
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+    _disk_cache_put(signature, report)
+
+    return report
+
+
+validate_profile.cache_clear = clear_validation_cache  # type: ignore[attr-defined]
+
+
+# ============================================================================
+# Batch validation
+# ============================================================================
+
+_TARGET_OS_ID = {"macos": 0, "windows": 1, "linux": 2}
+
+# Bit flags emitted by the vectorized scalar scan
+_F_INVALID_CORE_COUNT = 1 << 0
+_F_HIGH_CORE_COUNT = 1 << 1
+_F_MACOS_TOUCH_UNUSUAL = 1 << 2
+_F_COLOR_DEPTH_UNUSUAL = 1 << 3
+_F_MACOS_DPR_UNUSUAL = 1 << 4
+_F_WINDOWS_DPR_UNUSUAL = 1 << 5
+_F_SMALL_SCREEN = 1 << 6
+_F_INVALID_AVAIL_DIMENSIONS = 1 << 7
+
+
+def _scan_scalar_fields(
+    os_id: np.ndarray,
+    cores: np.ndarray,
+    touch: np.ndarray,
+    depth: np.ndarray,
+    dpr: np.ndarray,
+    w: np.ndarray,
+    h: np.ndarray,
+    aw: np.ndarray,
+    ah: np.ndarray,
+) -> np.ndarray:
+    """Vectorized kernel: one bitmask of fired scalar checks per profile."""
+    flags = np.zeros(len(os_id), dtype=np.uint32)
+
+    is_macos = os_id == 0
+    is_windows = os_id == 1
+
+    flags |= np.where(cores < 1, _F_INVALID_CORE_COUNT, 0).astype(np.uint32)
+    flags |= np.where((cores >= 1) & (cores > 64), _F_HIGH_CORE_COUNT, 0).astype(np.uint32)
+    flags |= np.where(is_macos & (touch > 0), _F_MACOS_TOUCH_UNUSUAL, 0).astype(np.uint32)
+    flags |= np.where(
+        (depth != 24) & (depth != 30) & (depth != 32), _F_COLOR_DEPTH_UNUSUAL, 0
+    ).astype(np.uint32)
+
+    macos_dpr_bad = is_macos & (dpr != 1.0) & (dpr != 2.0)
+    windows_dpr_bad = (
+        is_windows
+        & (dpr != 1.0) & (dpr != 1.25) & (dpr != 1.5) & (dpr != 1.75) & (dpr != 2.0)
+    )
+    flags |= np.where(macos_dpr_bad, _F_MACOS_DPR_UNUSUAL, 0).astype(np.uint32)
+    flags |= np.where(windows_dpr_bad, _F_WINDOWS_DPR_UNUSUAL, 0).astype(np.uint32)
+
+    small = (w < 800) | (h < 600)
+    flags |= np.where(small, _F_SMALL_SCREEN, 0).astype(np.uint32)
+    flags |= np.where(
+        ~small & ((aw > w) | (ah > h)), _F_INVALID_AVAIL_DIMENSIONS, 0
+    ).astype(np.uint32)
+
+    return flags
+
+
+def _issues_from_flags(profile: ProfileConfig, flags: int) -> List[ConsistencyIssue]:
+    """
+    Assemble the full issue list for one profile from its scalar bitmask.
+
+    String-based checks (platform/oscpu/UA/timezone/WebGL/WebRTC) still run
+    per profile; the scalar results come from the precomputed bitmask.
+    Issue ordering matches _run_all_checks.
+    """
+    nav = profile.navigator
+    scr = profile.screen
     issues: List[ConsistencyIssue] = []
-    
-    # Run all checks
-    checks = [
+
+    for check in (
         check_os_platform_consistency,
         check_os_oscpu_consistency,
         check_os_useragent_consistency,
         check_timezone_locale_consistency,
-        check_screen_dpr_consistency,
-        check_webgl_os_consistency,
-        check_touch_macos_consistency,
-        check_webrtc_proxy_consistency,
-        check_color_depth_consistency,
-        check_hardware_concurrency,
-        check_screen_dimensions,
-    ]
-    
-    for check in checks:
+    ):
         issue = check(profile)
         if issue:
             issues.append(issue)
-    
-    # Profile is valid if there are no errors
-    is_valid = not any(i.level == ConsistencyLevel.ERROR for i in issues)
-    
-    return ConsistencyReport(
-        profile_id=profile.id,
-        profile_name=profile.name,
-        is_valid=is_valid,
-        issues=issues,
-    )
+
+    if flags & _F_MACOS_DPR_UNUSUAL:
+        issues.append(_macos_dpr_issue(scr.device_pixel_ratio))
+    elif flags & _F_WINDOWS_DPR_UNUSUAL:
+        issues.append(_windows_dpr_issue(scr.device_pixel_ratio))
+
+    issue = check_webgl_os_consistency(profile)
+    if issue:
+        issues.append(issue)
+
+    if flags & _F_MACOS_TOUCH_UNUSUAL:
+        issues.append(_macos_touch_issue(nav.max_touch_points))
+
+    issue = check_webrtc_proxy_consistency(profile)
+    if issue:
+        issues.append(issue)
+
+    if flags & _F_COLOR_DEPTH_UNUSUAL:
+        issues.append(_color_depth_issue(scr.color_depth))
+
+    if flags & _F_INVALID_CORE_COUNT:
+        issues.append(_invalid_cores_issue())
+    elif flags & _F_HIGH_CORE_COUNT:
+        issues.append(_high_cores_issue(nav.hardware_concurrency))
+
+    if flags & _F_SMALL_SCREEN:
+        issues.append(_small_screen_issue(scr.width, scr.height))
+    elif flags & _F_INVALID_AVAIL_DIMENSIONS:
+        issues.append(_invalid_avail_issue())
+
+    return issues
+
+
+def validate_profiles_batch(profiles: Sequence[ProfileConfig]) -> List[ConsistencyReport]:
+    """
+    Validate many profiles at once.
+
+    The scalar checks (core count, touch points, color depth, DPR, screen
+    dimensions) run as one vectorized NumPy pass over packed arrays instead
+    of per-profile Python comparisons; the string checks run per profile as
+    usual. Results are equivalent to calling validate_profile on each
+    profile, and hit the same in-process signature cache. Unlike
+    validate_profile, the batch path deliberately skips the on-disk cache
+    tier: batch callers typically validate freshly listed profiles within
+    one process, where the in-memory LRU already absorbs the repeats.
+
+    Args:
+        profiles: The profiles to validate.
+
+    Returns:
+        One ConsistencyReport per profile, in input order.
+    """
+    profiles = list(profiles)
+    reports: List[Optional[ConsistencyReport]] = [None] * len(profiles)
+
+    # Serve cached results first; only misses go through the kernel
+    misses: List[Tuple[int, ProfileConfig, str]] = []
+    for idx, profile in enumerate(profiles):
+        signature = _profile_signature(profile)
+        cached = _VALIDATION_CACHE.get(signature)
+        if cached is not None:
+            _VALIDATION_CACHE.move_to_end(signature)
+            if cached.profile_id != profile.id or cached.profile_name != profile.name:
+                cached = ConsistencyReport(
+                    profile_id=profile.id,
+                    profile_name=profile.name,
+                    is_valid=cached.is_valid,
+                    issues=cached.issues,
+                )
+            reports[idx] = cached
+        else:
+            misses.append((idx, profile, signature))
+
+    if misses:
+        n = len(misses)
+        os_id = np.fromiter(
+            (_TARGET_OS_ID.get(p.target_os, -1) for _, p, _ in misses),
+            dtype=np.int64, count=n,
+        )
+        cores = np.fromiter((p.navigator.hardware_concurrency for _, p, _ in misses), dtype=np.int64, count=n)
+        touch = np.fromiter((p.navigator.max_touch_points for _, p, _ in misses), dtype=np.int64, count=n)
+        depth = np.fromiter((p.screen.color_depth for _, p, _ in misses), dtype=np.int64, count=n)
+        dpr = np.fromiter((p.screen.device_pixel_ratio for _, p, _ in misses), dtype=np.float64, count=n)
+        w = np.fromiter((p.screen.width for _, p, _ in misses), dtype=np.int64, count=n)
+        h = np.fromiter((p.screen.height for _, p, _ in misses), dtype=np.int64, count=n)
+        aw = np.fromiter((p.screen.avail_width for _, p, _ in misses), dtype=np.int64, count=n)
+        ah = np.fromiter((p.screen.avail_height for _, p, _ in misses), dtype=np.int64, count=n)
+
+        all_flags = _scan_scalar_fields(os_id, cores, touch, depth, dpr, w, h, aw, ah)
+
+        for (idx, profile, signature), flags in zip(misses, all_flags):
+            issues = _issues_from_flags(profile, int(flags))
+            report = ConsistencyReport(
+                profile_id=profile.id,
+                profile_name=profile.name,
+                is_valid=not any(i.level is ConsistencyLevel.ERROR for i in issues),
+                issues=issues,
+            )
+            _VALIDATION_CACHE[signature] = report
+            if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_MAXSIZE:
+                _VALIDATION_CACHE.popitem(last=False)
+            reports[idx] = report
+
+    return reports  # type: ignore[return-value]
+
+
+# Per-OS enforcers specialized at import time: the OS selection collapses to
+# one dict lookup and each enforcer is straight-line assignment with the
+# default strings baked in as constants.
+def _enforce_macos(profile: ProfileConfig) -> None:
+    nav = profile.navigator
+    if not nav.platform:
+        nav.platform = "MacIntel"
+    if not nav.oscpu:
+        nav.oscpu = "Intel Mac OS X 10.15"
+
+
+def _enforce_windows(profile: ProfileConfig) -> None:
+    nav = profile.navigator
+    if not nav.platform:
+        nav.platform = "Win32"
+    if not nav.oscpu:
+        nav.oscpu = "Windows NT 10.0; Win64; x64"
+
+
+def _enforce_linux(profile: ProfileConfig) -> None:
+    nav = profile.navigator
+    if not nav.platform:
+        nav.platform = "Linux x86_64"
+    if not nav.oscpu:
+        nav.oscpu = "Linux x86_64"
+
+
+def _enforce_unknown(profile: ProfileConfig) -> None:
+    nav = profile.navigator
+    if not nav.platform:
+        nav.platform = ""
+    if not nav.oscpu:
+        nav.oscpu = ""
+
+
+_ENFORCERS = MappingProxyType({
+    "macos": _enforce_macos,
+    "windows": _enforce_windows,
+    "linux": _enforce_linux,
+})
 
 
 def enforce_os_consistency(profile: ProfileConfig) -> ProfileConfig:
     """
     Automatically fix obvious OS inconsistencies in a profile.
-    
+
     This function updates navigator fields to match the target OS
     if they are not already set.
-    
+
     Args:
         profile: The profile to fix.
-    
+
     Returns:
         The modified profile (same object, mutated).
     """
-    os_defaults = {
-        "macos": {
-            "platform": "MacIntel",
-            "oscpu": "Intel Mac OS X 10.15",
-            "ua_pattern": "Macintosh; Intel Mac OS X 10.15",
-        },
-        "windows": {
-            "platform": "Win32",
-            "oscpu": "Windows NT 10.0; Win64; x64",
-            "ua_pattern": "Windows NT 10.0; Win64; x64",
-        },
-        "linux": {
-            "platform": "Linux x86_64",
-            "oscpu": "Linux x86_64",
-            "ua_pattern": "X11; Linux x86_64",
-        },
-    }
-    
-    defaults = os_defaults.get(profile.target_os, {})
-    
-    # Set platform if not set
-    if not profile.navigator.platform:
-        profile.navigator.platform = defaults.get("platform", "")
-    
-    # Set oscpu if not set
-    if not profile.navigator.oscpu:
-        profile.navigator.oscpu = defaults.get("oscpu", "")
-    
+    _ENFORCERS.get(profile.target_os, _enforce_unknown)(profile)
     return profile
 
 
@@ -518,25 +1169,28 @@ def get_consistency_summary(profile: ProfileConfig) -> Dict[str, Any]:
     Returns a simplified dictionary suitable for rendering in UI.
     """
     report = validate_profile(profile)
-    
-    # Group issues by field
+
+    # One pass over the issues: group per-field status by severity rank and
+    # build the UI issue list at the same time.
     field_status: Dict[str, str] = {}
+    field_rank: Dict[str, int] = {}
+    issues_out: List[Dict[str, str]] = []
     for issue in report.issues:
-        current = field_status.get(issue.field)
-        if current is None or issue.level == ConsistencyLevel.ERROR:
-            field_status[issue.field] = issue.level.value
-    
+        level_value = issue.level.value
+        rank = _LEVEL_RANK[level_value]
+        if rank > field_rank.get(issue.field, -1):
+            field_status[issue.field] = level_value
+            field_rank[issue.field] = rank
+        issues_out.append({
+            "level": level_value,
+            "message": issue.message,
+            "suggestion": issue.suggestion,
+        })
+
     return {
         "is_valid": report.is_valid,
         "error_count": report.error_count,
         "warning_count": report.warning_count,
         "field_status": field_status,
-        "issues": [
-            {
-                "level": i.level.value,
-                "message": i.message,
-                "suggestion": i.suggestion,
-            }
-            for i in report.issues
-        ],
+        "issues": issues_out,
     }
@@ -10,10 +10,18 @@ Each preset is built from real captured fingerprints and contains only
 fields that Camoufox can reliably spoof.
 """
 
+import copy
+import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from .profile import (
+    _DATACLASS_SLOTS,
     LocaleConfig,
     NavigatorConfig,
     ProfileConfig,
@@ -23,7 +31,7 @@ from .profile import (
 )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PresetMetadata:
     """Metadata for a fingerprint preset."""
     
@@ -36,6 +44,43 @@ class PresetMetadata:
     capture_date: str
 
 
+def _fresh_copy(template: ProfileConfig, name: str) -> ProfileConfig:
+    """Clone a preset template with a fresh identity (id, name, timestamps)."""
+    profile = copy.deepcopy(template)
+    profile.id = str(uuid.uuid4())
+    profile.name = name
+    now = datetime.now().isoformat()
+    profile.created_at = now
+    profile.updated_at = now
+    return profile
+
+
+@lru_cache(maxsize=64)
+def _navigator(
+    user_agent: str,
+    platform: str,
+    oscpu: str,
+    hardware_concurrency: int,
+    max_touch_points: int,
+    languages: Tuple[str, ...],
+) -> NavigatorConfig:
+    """
+    Flyweight NavigatorConfig factory keyed by field values.
+
+    Templates with identical navigator fields (e.g. Windows 10 and 11) share
+    one instance; sharing is safe because templates are deep-copied before
+    being handed to callers.
+    """
+    return NavigatorConfig(
+        user_agent=user_agent,
+        platform=platform,
+        oscpu=oscpu,
+        hardware_concurrency=hardware_concurrency,
+        max_touch_points=max_touch_points,
+        languages=list(languages),
+    )
+
+
 # ============================================================================
 # macOS Apple Silicon Presets
 # ============================================================================
@@ -87,44 +132,40 @@ MACOS_WEBGL = WebGLConfig(
 )
 
 
+def _build_macos_apple_silicon(retina: bool) -> ProfileConfig:
+    """Construct a macOS Apple Silicon template (run once at import)."""
+    return ProfileConfig(
+        target_os="macos",
+        browser_family="firefox",
+        navigator=_navigator(
+            MACOS_SONOMA_M1_CHROME_UA,
+            "MacIntel",
+            "Intel Mac OS X 10.15",
+            8,
+            0,
+            ("en-US", "en"),
+        ),
+        screen=MACOS_RETINA_SCREEN if retina else MACOS_STANDARD_SCREEN,
+        locale=MACOS_LOCALE,
+        webgl=MACOS_WEBGL,
+    )
+
+
 def get_macos_apple_silicon_preset(
     name: str = "macOS Apple Silicon",
     retina: bool = True,
 ) -> ProfileConfig:
     """
     Create a macOS Apple Silicon profile preset.
-    
+
     Args:
         name: Profile name.
         retina: Use Retina display settings (default True).
-    
+
     Returns:
         ProfileConfig configured for macOS Apple Silicon.
     """
-    return ProfileConfig(
-        name=name,
-        target_os="macos",
-        browser_family="firefox",
-        navigator=NavigatorConfig(
-            user_agent=MACOS_SONOMA_M1_CHROME_UA,
-            platform="MacIntel",
-            oscpu="Intel Mac OS X 10.15",
-            hardware_concurrency=8,
-            max_touch_points=0,
-            languages=["en-US", "en"],
-        ),
-        screen=MACOS_RETINA_SCREEN if retina else MACOS_STANDARD_SCREEN,
-        locale=LocaleConfig(
-            language="en",
-            region="US",
-            timezone="America/Los_Angeles",
-        ),
-        webgl=WebGLConfig(
-            enabled=True,
-            vendor="Apple Inc.",
-            renderer="Apple M1",
-        ),
-    )
+    return _fresh_copy(_TEMPLATES[("macos", bool(retina))], name)
 
 
 # ============================================================================
@@ -196,22 +237,9 @@ WINDOWS_INTEL_WEBGL = WebGLConfig(
 )
 
 
-def get_windows_11_preset(
-    name: str = "Windows 11",
-    gpu_type: str = "nvidia",
-    scaling: float = 1.0,
-) -> ProfileConfig:
-    """
-    Create a Windows 11 profile preset.
-    
-    Args:
-        name: Profile name.
-        gpu_type: GPU type - 'nvidia', 'amd', or 'intel'.
-        scaling: Display scaling factor (1.0, 1.25, 1.5).
-    
-    Returns:
-        ProfileConfig configured for Windows 11.
-    """
+@lru_cache(maxsize=None)
+def _build_windows_11(gpu_type: str, scaling: float) -> ProfileConfig:
+    """Construct a Windows 11 template (memoized per combination)."""
     # Select WebGL config based on GPU type
     webgl_configs = {
         "nvidia": WINDOWS_NVIDIA_WEBGL,
@@ -219,10 +247,12 @@ def get_windows_11_preset(
         "intel": WINDOWS_INTEL_WEBGL,
     }
     webgl = webgl_configs.get(gpu_type, WINDOWS_NVIDIA_WEBGL)
-    
+
     # Select screen config based on scaling
     if scaling == 1.25:
         screen = WINDOWS_FHD_125_SCREEN
+    elif scaling == 1.0:
+        screen = WINDOWS_FHD_SCREEN
     else:
         screen = ScreenConfig(
             width=1920,
@@ -232,47 +262,96 @@ def get_windows_11_preset(
             device_pixel_ratio=scaling,
             color_depth=24,
         )
-    
+
     return ProfileConfig(
-        name=name,
         target_os="windows",
         browser_family="firefox",
-        navigator=NavigatorConfig(
-            user_agent=WINDOWS_11_UA,
-            platform="Win32",
-            oscpu="Windows NT 10.0; Win64; x64",
-            hardware_concurrency=8,
-            max_touch_points=0,
-            languages=["en-US", "en"],
+        navigator=_navigator(
+            WINDOWS_11_UA,
+            "Win32",
+            "Windows NT 10.0; Win64; x64",
+            8,
+            0,
+            ("en-US", "en"),
         ),
         screen=screen,
-        locale=LocaleConfig(
-            language="en",
-            region="US",
-            timezone="America/New_York",
-        ),
-        webgl=WebGLConfig(
-            enabled=webgl.enabled,
-            vendor=webgl.vendor,
-            renderer=webgl.renderer,
-        ),
+        locale=WINDOWS_LOCALE,
+        webgl=webgl,
     )
 
 
-def get_windows_10_preset(
-    name: str = "Windows 10",
+def build_windows_screens(
+    scalings: Union[Sequence[float], "np.ndarray"],
+) -> List[ScreenConfig]:
+    """
+    Bulk-build Windows ScreenConfigs for an array of scaling factors.
+
+    Intended for profile-pool spawning, where many Windows profiles are
+    created with varying display scaling: the numeric fields are derived in
+    one vectorized pass instead of per-call Python branches, and the common
+    1.0/1.25 factors resolve to the shared module-level screen constants.
+    Returned configs may be shared flyweights; deep-copy before mutating.
+
+    Args:
+        scalings: Display scaling factor per profile.
+
+    Returns:
+        One ScreenConfig per scaling factor, in input order.
+    """
+    ratios = np.asarray(scalings, dtype=np.float64)
+    # All current Windows catalog entries are 1920x1080 with a 40px taskbar;
+    # avail_height stays constant across scaling factors.
+    avail_heights = np.full(ratios.shape, 1040, dtype=np.int64)
+    is_fhd = ratios == 1.0
+    is_fhd_125 = ratios == 1.25
+
+    screens: List[ScreenConfig] = []
+    append = screens.append
+    for ratio, avail_height, fhd, fhd_125 in zip(
+        ratios.tolist(), avail_heights.tolist(), is_fhd.tolist(), is_fhd_125.tolist()
+    ):
+        if fhd:
+            append(WINDOWS_FHD_SCREEN)
+        elif fhd_125:
+            append(WINDOWS_FHD_125_SCREEN)
+        else:
+            append(ScreenConfig(
+                width=1920,
+                height=1080,
+                avail_width=1920,
+                avail_height=avail_height,
+                device_pixel_ratio=ratio,
+                color_depth=24,
+            ))
+    return screens
+
+
+def get_windows_11_preset(
+    name: str = "Windows 11",
     gpu_type: str = "nvidia",
+    scaling: float = 1.0,
 ) -> ProfileConfig:
     """
-    Create a Windows 10 profile preset.
-    
+    Create a Windows 11 profile preset.
+
     Args:
         name: Profile name.
         gpu_type: GPU type - 'nvidia', 'amd', or 'intel'.
-    
+        scaling: Display scaling factor (1.0, 1.25, 1.5).
+
     Returns:
-        ProfileConfig configured for Windows 10.
+        ProfileConfig configured for Windows 11.
     """
+    template = _TEMPLATES.get(("windows11", gpu_type, scaling))
+    if template is None:
+        # Uncommon GPU/scaling combination: build on demand.
+        template = _build_windows_11(gpu_type, scaling)
+    return _fresh_copy(template, name)
+
+
+@lru_cache(maxsize=None)
+def _build_windows_10(gpu_type: str) -> ProfileConfig:
+    """Construct a Windows 10 template (memoized per GPU type)."""
     # Select WebGL config based on GPU type
     webgl_configs = {
         "nvidia": WINDOWS_NVIDIA_WEBGL,
@@ -280,33 +359,44 @@ def get_windows_10_preset(
         "intel": WINDOWS_INTEL_WEBGL,
     }
     webgl = webgl_configs.get(gpu_type, WINDOWS_NVIDIA_WEBGL)
-    
+
     return ProfileConfig(
-        name=name,
         target_os="windows",
         browser_family="firefox",
-        navigator=NavigatorConfig(
-            user_agent=WINDOWS_10_UA,  # Windows 10 specific UA
-            platform="Win32",
-            oscpu="Windows NT 10.0; Win64; x64",
-            hardware_concurrency=8,
-            max_touch_points=0,
-            languages=["en-US", "en"],
+        navigator=_navigator(
+            WINDOWS_10_UA,  # Windows 10 specific UA
+            "Win32",
+            "Windows NT 10.0; Win64; x64",
+            8,
+            0,
+            ("en-US", "en"),
         ),
         screen=WINDOWS_FHD_SCREEN,
-        locale=LocaleConfig(
-            language="en",
-            region="US",
-            timezone="America/New_York",
-        ),
-        webgl=WebGLConfig(
-            enabled=webgl.enabled,
-            vendor=webgl.vendor,
-            renderer=webgl.renderer,
-        ),
+        locale=WINDOWS_LOCALE,
+        webgl=webgl,
     )
 
 
+def get_windows_10_preset(
+    name: str = "Windows 10",
+    gpu_type: str = "nvidia",
+) -> ProfileConfig:
+    """
+    Create a Windows 10 profile preset.
+
+    Args:
+        name: Profile name.
+        gpu_type: GPU type - 'nvidia', 'amd', or 'intel'.
+
+    Returns:
+        ProfileConfig configured for Windows 10.
+    """
+    template = _TEMPLATES.get(("windows10", gpu_type))
+    if template is None:
+        template = _build_windows_10(gpu_type)
+    return _fresh_copy(template, name)
+
+
 # ============================================================================
 # Linux Presets
 # ============================================================================
@@ -347,57 +437,70 @@ LINUX_MESA_WEBGL = WebGLConfig(
 )
 
 
+def _build_linux_desktop() -> ProfileConfig:
+    """Construct the Linux desktop template (run once at import)."""
+    return ProfileConfig(
+        target_os="linux",
+        browser_family="firefox",
+        navigator=_navigator(
+            LINUX_UBUNTU_UA,
+            "Linux x86_64",
+            "Linux x86_64",
+            4,
+            0,
+            ("en-US", "en"),
+        ),
+        screen=LINUX_FHD_SCREEN,
+        locale=LINUX_LOCALE,
+        webgl=LINUX_MESA_WEBGL,
+    )
+
+
 def get_linux_desktop_preset(
     name: str = "Linux Desktop",
 ) -> ProfileConfig:
     """
     Create a Linux desktop profile preset (Ubuntu-like).
-    
+
     Args:
         name: Profile name.
-    
+
     Returns:
         ProfileConfig configured for Linux desktop.
     """
-    return ProfileConfig(
-        name=name,
-        target_os="linux",
-        browser_family="firefox",
-        navigator=NavigatorConfig(
-            user_agent=LINUX_UBUNTU_UA,
-            platform="Linux x86_64",
-            oscpu="Linux x86_64",
-            hardware_concurrency=4,
-            max_touch_points=0,
-            languages=["en-US", "en"],
-        ),
-        screen=ScreenConfig(
-            width=1920,
-            height=1080,
-            avail_width=1920,
-            avail_height=1053,
-            device_pixel_ratio=1.0,
-            color_depth=24,
-        ),
-        locale=LocaleConfig(
-            language="en",
-            region="US",
-            timezone="America/New_York",
-        ),
-        webgl=WebGLConfig(
-            enabled=True,
-            vendor="Mesa",
-            renderer="Mesa Intel(R) UHD Graphics 620 (KBL GT2)",
-        ),
-    )
+    return _fresh_copy(_TEMPLATES[("linux",)], name)
+
+
+# ============================================================================
+# Preset Templates
+# ============================================================================
+
+# One fully-built ProfileConfig per common preset combination, constructed a
+# single time at import. The preset factories deep-copy a template and stamp
+# a fresh identity instead of re-instantiating every nested config per call.
+_TEMPLATES: Dict[Tuple[Any, ...], ProfileConfig] = {
+    ("macos", True): _build_macos_apple_silicon(retina=True),
+    ("macos", False): _build_macos_apple_silicon(retina=False),
+    ("windows11", "nvidia", 1.0): _build_windows_11("nvidia", 1.0),
+    ("windows11", "amd", 1.0): _build_windows_11("amd", 1.0),
+    ("windows11", "intel", 1.0): _build_windows_11("intel", 1.0),
+    ("windows11", "nvidia", 1.25): _build_windows_11("nvidia", 1.25),
+    ("windows11", "amd", 1.25): _build_windows_11("amd", 1.25),
+    ("windows11", "intel", 1.25): _build_windows_11("intel", 1.25),
+    ("windows10", "nvidia"): _build_windows_10("nvidia"),
+    ("windows10", "amd"): _build_windows_10("amd"),
+    ("windows10", "intel"): _build_windows_10("intel"),
+    ("linux",): _build_linux_desktop(),
+}
 
 
 # ============================================================================
 # Preset Registry
 # ============================================================================
 
-# Available preset identifiers
-AVAILABLE_PRESETS = [
+# Available preset identifiers. A tuple: immutable, hashable (safe to share
+# across threads and pytest-xdist workers) and allocated once at import.
+AVAILABLE_PRESETS = (
     "macos_apple_silicon",
     "macos_apple_silicon_standard",
     "windows_11",
@@ -405,7 +508,7 @@ AVAILABLE_PRESETS = [
     "windows_11_intel",
     "windows_10",
     "linux_desktop",
-]
+)
 
 # Preset metadata for documentation
 PRESET_METADATA: Dict[str, PresetMetadata] = {
@@ -475,52 +578,72 @@ PRESET_METADATA: Dict[str, PresetMetadata] = {
 }
 
 
+# Preset factories, bound once at import time instead of rebuilding a dict of
+# closures on every get_preset call.
+_PRESET_FACTORIES: Mapping[str, Callable[[], ProfileConfig]] = MappingProxyType({
+    "macos_apple_silicon": partial(get_macos_apple_silicon_preset, retina=True),
+    "macos_apple_silicon_standard": partial(get_macos_apple_silicon_preset, retina=False),
+    "windows_11": partial(get_windows_11_preset, gpu_type="nvidia"),
+    "windows_11_amd": partial(get_windows_11_preset, gpu_type="amd"),
+    "windows_11_intel": partial(get_windows_11_preset, gpu_type="intel"),
+    "windows_10": get_windows_10_preset,
+    "linux_desktop": get_linux_desktop_preset,
+})
+
+# Pre-formatted once: the error path should not re-join the preset list.
+_AVAILABLE_PRESETS_HINT = ", ".join(AVAILABLE_PRESETS)
+
+
 def get_preset(preset_id: str) -> ProfileConfig:
     """
     Get a profile preset by ID.
-    
+
     Args:
         preset_id: The preset identifier. See AVAILABLE_PRESETS for options.
-    
+
     Returns:
         ProfileConfig with preset values.
-    
+
     Raises:
         ValueError: If preset_id is not recognized.
-    
+
     Example:
         >>> profile = get_preset("macos_apple_silicon")
         >>> profile.target_os
         'macos'
     """
-    preset_factories = {
-        "macos_apple_silicon": lambda: get_macos_apple_silicon_preset(retina=True),
-        "macos_apple_silicon_standard": lambda: get_macos_apple_silicon_preset(retina=False),
-        "windows_11": lambda: get_windows_11_preset(gpu_type="nvidia"),
-        "windows_11_amd": lambda: get_windows_11_preset(gpu_type="amd"),
-        "windows_11_intel": lambda: get_windows_11_preset(gpu_type="intel"),
-        "windows_10": lambda: get_windows_10_preset(),
-        "linux_desktop": lambda: get_linux_desktop_preset(),
-    }
-    
-    factory = preset_factories.get(preset_id)
+    factory = _PRESET_FACTORIES.get(preset_id)
     if factory is None:
         raise ValueError(
             f"Unknown preset: '{preset_id}'. "
-            f"Available presets: {', '.join(AVAILABLE_PRESETS)}"
+            f"Available presets: {_AVAILABLE_PRESETS_HINT}"
         )
-    
+
     return factory()
 
 
-def list_presets() -> List[PresetMetadata]:
+# Metadata snapshot frozen once at import; PRESET_METADATA never changes at
+# runtime, so list_presets can hand out the same immutable sequence.
+_PRESET_METADATA_LIST: Tuple[PresetMetadata, ...] = tuple(PRESET_METADATA.values())
+
+
+def list_presets() -> Sequence[PresetMetadata]:
     """
     Get metadata for all available presets.
-    
+
     Returns:
-        List of preset metadata.
+        Immutable sequence of preset metadata.
     """
-    return list(PRESET_METADATA.values())
+    return _PRESET_METADATA_LIST
+
+
+# Default preset per OS, resolved once at import instead of rebuilding the
+# mapping on each call.
+_OS_DEFAULT_PRESET: Mapping[str, str] = MappingProxyType({
+    "macos": "macos_apple_silicon",
+    "windows": "windows_11",
+    "linux": "linux_desktop",
+})
 
 
 def get_preset_for_os(target_os: str) -> ProfileConfig:
@@ -533,14 +656,8 @@ def get_preset_for_os(target_os: str) -> ProfileConfig:
     Returns:
         ProfileConfig with default preset for the OS.
     """
-    os_defaults = {
-        "macos": "macos_apple_silicon",
-        "windows": "windows_11",
-        "linux": "linux_desktop",
-    }
-    
-    preset_id = os_defaults.get(target_os)
+    preset_id = _OS_DEFAULT_PRESET.get(target_os)
     if preset_id is None:
         raise ValueError(f"Unknown OS: '{target_os}'")
-    
+
     return get_preset(preset_id)
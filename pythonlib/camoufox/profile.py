@@ -8,24 +8,40 @@ This module provides:
 """
 
 import os
+import sys
 import uuid
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Mapping, Optional, Tuple, Union
 
 import orjson
 
 # Profile schema version for future migrations
 PROFILE_SCHEMA_VERSION = "1.0.0"
 
+# dataclass(slots=True) needs Python 3.10+; fall back to regular dataclasses
+# on older interpreters. Slots cut the per-instance __dict__, which adds up
+# across the 8+ nested configs in every stored profile.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Shared read-only empty mapping returned by the default-config fast paths
+# below, so the common "nothing to configure" case allocates nothing.
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+# Below this many uncached files, list_profiles reads serially; thread-pool
+# dispatch costs more than it saves for a handful of local files.
+_PARALLEL_READ_THRESHOLD = 8
+
 # Default profiles directory (relative to repository root)
 # Use resolve() to get absolute path and avoid fragile parent traversals
 _REPO_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 DEFAULT_PROFILES_DIR = _REPO_ROOT / "profiles"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProxyConfig:
     """Proxy configuration for browser profiles."""
     
@@ -46,7 +62,7 @@ class ProxyConfig:
         return proxy
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WebRTCConfig:
     """WebRTC configuration for browser profiles."""
     
@@ -54,15 +70,14 @@ class WebRTCConfig:
     spoof_ipv4: Optional[str] = None
     spoof_ipv6: Optional[str] = None
     
-    def get_firefox_prefs(self) -> Dict[str, Any]:
+    def get_firefox_prefs(self) -> Mapping[str, Any]:
         """Get Firefox preferences for WebRTC mode."""
-        prefs: Dict[str, Any] = {}
-        if self.mode == "disabled":
-            prefs["media.peerconnection.enabled"] = False
-        return prefs
+        if self.mode != "disabled":
+            return _EMPTY_CONFIG
+        return {"media.peerconnection.enabled": False}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ScreenConfig:
     """Screen configuration for fingerprint spoofing."""
     
@@ -86,7 +101,7 @@ class ScreenConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class NavigatorConfig:
     """Navigator properties for fingerprint spoofing."""
     
@@ -115,7 +130,7 @@ class NavigatorConfig:
         return config
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LocaleConfig:
     """Locale and timezone configuration."""
     
@@ -132,7 +147,7 @@ class LocaleConfig:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class WebGLConfig:
     """WebGL configuration for fingerprint spoofing."""
     
@@ -140,12 +155,11 @@ class WebGLConfig:
     vendor: str = ""
     renderer: str = ""
     
-    def get_firefox_prefs(self) -> Dict[str, Any]:
+    def get_firefox_prefs(self) -> Mapping[str, Any]:
         """Get Firefox preferences for WebGL."""
-        prefs: Dict[str, Any] = {}
-        if not self.enabled:
-            prefs["webgl.disabled"] = True
-        return prefs
+        if self.enabled:
+            return _EMPTY_CONFIG
+        return {"webgl.disabled": True}
     
     def to_camoufox_config(self) -> Dict[str, Any]:
         """Convert to Camoufox config format."""
@@ -157,22 +171,21 @@ class WebGLConfig:
         return config
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class StorageConfig:
     """Storage configuration for browser profiles."""
     
     user_data_dir: Optional[str] = None
     persistent_cookies: bool = True
     
-    def get_playwright_options(self) -> Dict[str, Any]:
+    def get_playwright_options(self) -> Mapping[str, Any]:
         """Get Playwright launch options for storage."""
-        options: Dict[str, Any] = {}
-        if self.user_data_dir:
-            options["user_data_dir"] = self.user_data_dir
-        return options
+        if not self.user_data_dir:
+            return _EMPTY_CONFIG
+        return {"user_data_dir": self.user_data_dir}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ProfileConfig:
     """
     Main profile configuration model.
@@ -217,9 +230,16 @@ class ProfileConfig:
     # Custom Camoufox config overrides
     custom_config: Dict[str, Any] = field(default_factory=dict)
     
-    def touch(self) -> None:
-        """Update the updated_at timestamp."""
-        self.updated_at = datetime.now().isoformat()
+    def touch(self, now_iso: Optional[str] = None) -> None:
+        """
+        Update the updated_at timestamp.
+
+        Args:
+            now_iso: Pre-formatted ISO timestamp to assign directly; computed
+                when omitted. Batch callers can format the time once and
+                reuse it across many profiles.
+        """
+        self.updated_at = now_iso if now_iso is not None else datetime.now().isoformat()
     
     def to_camoufox_config(self) -> Dict[str, Any]:
         """
@@ -227,23 +247,52 @@ class ProfileConfig:
         
         Returns a config dictionary that can be passed to Camoufox launcher.
         """
-        config: Dict[str, Any] = {}
-        
-        # Merge all component configs
-        config.update(self.navigator.to_camoufox_config())
-        config.update(self.screen.to_camoufox_config())
-        config.update(self.locale.to_camoufox_config())
-        config.update(self.webgl.to_camoufox_config())
-        
+        navigator = self.navigator
+        screen = self.screen
+        locale = self.locale
+        webgl = self.webgl
+        webrtc = self.webrtc
+
+        # One dict literal instead of chaining updates over per-component
+        # dicts; the component to_camoufox_config helpers remain for callers
+        # that need a single piece in isolation.
+        config: Dict[str, Any] = {
+            "navigator.hardwareConcurrency": navigator.hardware_concurrency,
+            "navigator.maxTouchPoints": navigator.max_touch_points,
+            "screen.width": screen.width,
+            "screen.height": screen.height,
+            "screen.availWidth": screen.avail_width,
+            "screen.availHeight": screen.avail_height,
+            "window.devicePixelRatio": screen.device_pixel_ratio,
+            "screen.colorDepth": screen.color_depth,
+            "screen.pixelDepth": screen.color_depth,
+            "locale:language": locale.language,
+            "locale:region": locale.region,
+            "timezone": locale.timezone,
+        }
+        if navigator.user_agent:
+            config["navigator.userAgent"] = navigator.user_agent
+        if navigator.platform:
+            config["navigator.platform"] = navigator.platform
+        if navigator.oscpu:
+            config["navigator.oscpu"] = navigator.oscpu
+        if navigator.languages:
+            config["navigator.languages"] = navigator.languages
+            config["navigator.language"] = navigator.languages[0]
+        if webgl.vendor:
+            config["webGl:vendor"] = webgl.vendor
+        if webgl.renderer:
+            config["webGl:renderer"] = webgl.renderer
+
         # Add WebRTC spoofing if configured
-        if self.webrtc.spoof_ipv4:
-            config["webrtc:ipv4"] = self.webrtc.spoof_ipv4
-        if self.webrtc.spoof_ipv6:
-            config["webrtc:ipv6"] = self.webrtc.spoof_ipv6
-        
+        if webrtc.spoof_ipv4:
+            config["webrtc:ipv4"] = webrtc.spoof_ipv4
+        if webrtc.spoof_ipv6:
+            config["webrtc:ipv6"] = webrtc.spoof_ipv6
+
         # Merge custom config (allows overrides)
         config.update(self.custom_config)
-        
+
         return config
     
     def get_firefox_prefs(self) -> Dict[str, Any]:
@@ -269,28 +318,149 @@ class ProfileConfig:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary for serialization."""
-        return asdict(self)
+        # Hand-rolled instead of dataclasses.asdict(): asdict deep-copies
+        # every field and recursively walks containers, which dominates the
+        # save()/list_profiles() round-trip for a tree this small. Mutable
+        # leaves are shallow-copied to keep the result isolated.
+        navigator = self.navigator
+        screen = self.screen
+        locale = self.locale
+        webgl = self.webgl
+        proxy = self.proxy
+        webrtc = self.webrtc
+        storage = self.storage
+        return {
+            "id": self.id,
+            "name": self.name,
+            "notes": self.notes,
+            "version": self.version,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "target_os": self.target_os,
+            "browser_family": self.browser_family,
+            "navigator": {
+                "user_agent": navigator.user_agent,
+                "platform": navigator.platform,
+                "oscpu": navigator.oscpu,
+                "hardware_concurrency": navigator.hardware_concurrency,
+                "max_touch_points": navigator.max_touch_points,
+                "languages": list(navigator.languages),
+            },
+            "screen": {
+                "width": screen.width,
+                "height": screen.height,
+                "avail_width": screen.avail_width,
+                "avail_height": screen.avail_height,
+                "device_pixel_ratio": screen.device_pixel_ratio,
+                "color_depth": screen.color_depth,
+            },
+            "locale": {
+                "language": locale.language,
+                "region": locale.region,
+                "timezone": locale.timezone,
+            },
+            "webgl": {
+                "enabled": webgl.enabled,
+                "vendor": webgl.vendor,
+                "renderer": webgl.renderer,
+            },
+            "proxy": {
+                "type": proxy.type,
+                "server": proxy.server,
+                "username": proxy.username,
+                "password": proxy.password,
+            },
+            "webrtc": {
+                "mode": webrtc.mode,
+                "spoof_ipv4": webrtc.spoof_ipv4,
+                "spoof_ipv6": webrtc.spoof_ipv6,
+            },
+            "storage": {
+                "user_data_dir": storage.user_data_dir,
+                "persistent_cookies": storage.persistent_cookies,
+            },
+            "startup_url": self.startup_url,
+            "startup_script": self.startup_script,
+            "custom_config": dict(self.custom_config),
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ProfileConfig":
         """Create profile from dictionary."""
-        # Handle nested dataclasses
-        if "navigator" in data and isinstance(data["navigator"], dict):
-            data["navigator"] = NavigatorConfig(**data["navigator"])
-        if "screen" in data and isinstance(data["screen"], dict):
-            data["screen"] = ScreenConfig(**data["screen"])
-        if "locale" in data and isinstance(data["locale"], dict):
-            data["locale"] = LocaleConfig(**data["locale"])
-        if "webgl" in data and isinstance(data["webgl"], dict):
-            data["webgl"] = WebGLConfig(**data["webgl"])
-        if "proxy" in data and isinstance(data["proxy"], dict):
-            data["proxy"] = ProxyConfig(**data["proxy"])
-        if "webrtc" in data and isinstance(data["webrtc"], dict):
-            data["webrtc"] = WebRTCConfig(**data["webrtc"])
-        if "storage" in data and isinstance(data["storage"], dict):
-            data["storage"] = StorageConfig(**data["storage"])
-        
-        return cls(**data)
+        # Handle nested dataclasses, driven by the field table below. The
+        # exact-type check (orjson only ever produces plain dicts) is cheaper
+        # than isinstance and one loop replaces seven copied branches. The
+        # caller's dict is left untouched: the shallow copy is only taken
+        # once the first nested field actually needs converting.
+        converted = None
+        for name, config_cls in _NESTED_FIELDS:
+            value = data.get(name)
+            if value is not None and value.__class__ is dict:
+                if converted is None:
+                    converted = dict(data)
+                converted[name] = config_cls(**value)
+
+        return cls(**(converted if converted is not None else data))
+
+
+# Nested config fields of ProfileConfig, used to rebuild the dataclass tree
+# in from_dict.
+_NESTED_FIELDS = (
+    ("navigator", NavigatorConfig),
+    ("screen", ScreenConfig),
+    ("locale", LocaleConfig),
+    ("webgl", WebGLConfig),
+    ("proxy", ProxyConfig),
+    ("webrtc", WebRTCConfig),
+    ("storage", StorageConfig),
+)
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ProfileSummary:
+    """
+    Lightweight view of a stored profile.
+
+    Carries just the fields needed to render profile lists (UI sidebars,
+    CLI tables) without constructing the full nested config tree.
+    """
+
+    id: str
+    name: str
+    target_os: str
+    updated_at: str
+
+
+def _read_bytes(path: Union[str, Path], size: int = -1) -> bytes:
+    """
+    Read a whole small file in one os.open/os.read round trip.
+
+    Profile JSON blobs are a few KB, so a single read sized from stat covers
+    the file without Python's buffered IO layer. Falls back to chunked reads
+    in the rare case the first read comes back short.
+
+    Args:
+        path: File to read.
+        size: Expected file size; taken from fstat when negative.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if size < 0:
+            size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size:
+            chunks = [data]
+            remaining = size - len(data)
+            while remaining:
+                chunk = os.read(fd, remaining)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            data = b"".join(chunks)
+        return data
+    finally:
+        os.close(fd)
 
 
 class ProfileStorage:
@@ -315,22 +485,79 @@ class ProfileStorage:
         
         # Ensure directory exists
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
+
+        # Parse cache indexed by file mtime: profiles whose JSON has not
+        # changed on disk are reused instead of re-parsed on every listing.
+        self._cache: Dict[str, Tuple[float, ProfileConfig]] = {}
     
     def _profile_path(self, profile_id: str) -> Path:
         """Get the file path for a profile."""
         return self.profiles_dir / f"{profile_id}.json"
     
-    def save(self, profile: ProfileConfig) -> None:
+    def save(
+        self,
+        profile: ProfileConfig,
+        _now_iso: Optional[str] = None,
+        *,
+        indent: bool = False,
+    ) -> None:
         """
         Save a profile to disk.
-        
+
         Args:
             profile: The profile to save.
+            _now_iso: Pre-formatted ISO timestamp for bulk saves, so a batch
+                caller pays for datetime.now().isoformat() once instead of
+                per profile.
+            indent: Pretty-print the JSON. Off by default: profiles are read
+                back by the library, and compact output is markedly smaller
+                and cheaper to format and re-parse. Pass True for exports a
+                human will edit.
         """
-        profile.touch()
+        profile.touch(_now_iso)
         path = self._profile_path(profile.id)
-        with open(path, "wb") as f:
-            f.write(orjson.dumps(profile.to_dict(), option=orjson.OPT_INDENT_2))
+        # Serialize the dataclass tree natively in C instead of building an
+        # intermediate dict on the Python side.
+        option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        blob = orjson.dumps(profile, option=option)
+        # Write to a sibling tmp file and rename into place: os.replace is
+        # atomic on POSIX and Windows, so readers never observe a
+        # half-written profile (the .tmp name is ignored by the listings).
+        tmp = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, blob)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp)
+            raise
+        else:
+            os.close(fd)
+        os.replace(tmp, path)
+        self._cache.pop(profile.id, None)
+    
+    def save_many(
+        self,
+        profiles: Iterable[ProfileConfig],
+        *,
+        indent: bool = False,
+    ) -> None:
+        """
+        Save a batch of profiles in one pass.
+
+        The ISO timestamp is formatted once and shared across the batch, so
+        bulk callers (e.g. importing a preset bundle) pay for
+        datetime.now().isoformat() once instead of per profile.
+
+        Args:
+            profiles: The profiles to save.
+            indent: Pretty-print the JSON, as in save().
+        """
+        now_iso = datetime.now().isoformat()
+        for profile in profiles:
+            self.save(profile, now_iso, indent=indent)
     
     def load(self, profile_id: str) -> ProfileConfig:
         """
@@ -346,8 +573,7 @@ class ProfileStorage:
             FileNotFoundError: If the profile doesn't exist.
         """
         path = self._profile_path(profile_id)
-        with open(path, "rb") as f:
-            data = orjson.loads(f.read())
+        data = orjson.loads(_read_bytes(path))
         return ProfileConfig.from_dict(data)
     
     def delete(self, profile_id: str) -> bool:
@@ -360,37 +586,203 @@ class ProfileStorage:
         Returns:
             True if deleted, False if not found.
         """
+        self._cache.pop(profile_id, None)
         path = self._profile_path(profile_id)
         if path.exists():
             path.unlink()
             return True
         return False
     
+    def iter_profiles(
+        self,
+        target_os: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+    ) -> Iterator[ProfileConfig]:
+        """
+        Yield saved profiles one at a time.
+
+        Streams instead of materializing every profile at once, keeping
+        memory bounded for callers that paginate, search or filter. The
+        optional filters are checked against the raw top-level JSON fields
+        before the nested dataclass tree is built, so filtered-out files pay
+        only for the parse.
+
+        Yielded profiles may be served from the storage cache and shared
+        between calls: treat them as read-only and deep-copy before
+        mutating, or later listings will see the edits.
+
+        Args:
+            target_os: Only yield profiles with this target OS.
+            name_prefix: Only yield profiles whose name starts with this.
+        """
+        cache = self._cache
+        with os.scandir(self.profiles_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+        for entry in entries:
+            profile_id = entry.name[:-5]
+            stat = entry.stat()
+            mtime = stat.st_mtime
+            cached = cache.get(profile_id)
+            if cached is not None and cached[0] == mtime:
+                profile = cached[1]
+                if target_os is not None and profile.target_os != target_os:
+                    continue
+                if name_prefix is not None and not profile.name.startswith(name_prefix):
+                    continue
+                yield profile
+                continue
+            try:
+                data = orjson.loads(_read_bytes(entry.path, stat.st_size))
+            except OSError:
+                # File vanished or became unreadable mid-listing
+                continue
+            except orjson.JSONDecodeError:
+                # Skip invalid profile files
+                continue
+            if data.__class__ is not dict:
+                continue
+            # Cheap top-level filters before the nested tree is built
+            if target_os is not None and data.get("target_os") != target_os:
+                continue
+            if name_prefix is not None and not str(data.get("name", "")).startswith(name_prefix):
+                continue
+            try:
+                profile = ProfileConfig.from_dict(data)
+            except (TypeError, KeyError):
+                # Skip profiles with an unexpected schema (e.g. written by
+                # another version); our own saves are atomic, but externally
+                # edited or foreign files must not kill the whole listing.
+                continue
+            cache[profile_id] = (mtime, profile)
+            yield profile
+
     def list_profiles(self) -> List[ProfileConfig]:
         """
         List all saved profiles.
-        
+
+        When many files miss the mtime cache, their reads are overlapped on
+        a small thread pool (os.read releases the GIL), and parsing stays
+        serial in orjson's C code where it is already fast.
+
+        Returned profiles may be served from the storage cache and shared
+        between calls: treat them as read-only and deep-copy before
+        mutating, or later listings will see the edits.
+
         Returns:
             List of all profiles.
         """
-        profiles = []
-        for path in self.profiles_dir.glob("*.json"):
+        cache = self._cache
+        with os.scandir(self.profiles_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+
+        results: List[Optional[ProfileConfig]] = [None] * len(entries)
+        miss_slots: List[int] = []
+        miss_paths: List[str] = []
+        miss_sizes: List[int] = []
+        miss_meta: List[Tuple[str, float]] = []
+        for i, entry in enumerate(entries):
+            profile_id = entry.name[:-5]
+            stat = entry.stat()
+            cached = cache.get(profile_id)
+            if cached is not None and cached[0] == stat.st_mtime:
+                results[i] = cached[1]
+            else:
+                miss_slots.append(i)
+                miss_paths.append(entry.path)
+                miss_sizes.append(stat.st_size)
+                miss_meta.append((profile_id, stat.st_mtime))
+
+        def _safe_read(path: str, size: int) -> Optional[bytes]:
             try:
-                with open(path, "rb") as f:
-                    data = orjson.loads(f.read())
-                profiles.append(ProfileConfig.from_dict(data))
-            except (orjson.JSONDecodeError, TypeError, KeyError):
+                return _read_bytes(path, size)
+            except OSError:
+                # File vanished or became unreadable mid-listing
+                return None
+
+        if len(miss_paths) < _PARALLEL_READ_THRESHOLD:
+            blobs = [_safe_read(path, size) for path, size in zip(miss_paths, miss_sizes)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(miss_paths))) as executor:
+                blobs = list(executor.map(_safe_read, miss_paths, miss_sizes))
+
+        for slot, blob, (profile_id, mtime) in zip(miss_slots, blobs, miss_meta):
+            if blob is None:
+                continue
+            try:
+                data = orjson.loads(blob)
+            except orjson.JSONDecodeError:
                 # Skip invalid profile files
                 continue
-        return profiles
+            if data.__class__ is not dict:
+                continue
+            try:
+                profile = ProfileConfig.from_dict(data)
+            except (TypeError, KeyError):
+                # Skip profiles with an unexpected schema, as in iter_profiles
+                continue
+            cache[profile_id] = (mtime, profile)
+            results[slot] = profile
+
+        return [profile for profile in results if profile is not None]
     
+    def list_profile_summaries(self) -> List[ProfileSummary]:
+        """
+        List lightweight summaries of all saved profiles.
+
+        Parses each JSON file but only extracts the top-level metadata
+        fields, skipping the nested dataclass construction that
+        list_profiles() performs. Prefer this when callers only need
+        id/name/target_os/updated_at.
+
+        Returns:
+            List of profile summaries.
+        """
+        summaries = []
+        with os.scandir(self.profiles_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
+        for entry in entries:
+            try:
+                data = orjson.loads(_read_bytes(entry.path, entry.stat().st_size))
+            except OSError:
+                # File vanished or became unreadable mid-listing
+                continue
+            except orjson.JSONDecodeError:
+                # Skip invalid profile files
+                continue
+            if data.__class__ is not dict:
+                continue
+            profile_id = data.get("id")
+            if profile_id is None:
+                continue
+            summaries.append(ProfileSummary(
+                id=profile_id,
+                name=data.get("name", ""),
+                target_os=data.get("target_os", ""),
+                updated_at=data.get("updated_at", ""),
+            ))
+        return summaries
+
     def exists(self, profile_id: str) -> bool:
         """Check if a profile exists."""
         return self._profile_path(profile_id).exists()
     
     def get_profile_ids(self) -> List[str]:
         """Get list of all profile IDs."""
-        return [p.stem for p in self.profiles_dir.glob("*.json")]
+        with os.scandir(self.profiles_dir) as it:
+            return [
+                entry.name[:-5]
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+            ]
 
 
 # Default storage instance
@@ -423,3 +815,8 @@ def delete_profile(profile_id: str) -> bool:
 def list_profiles() -> List[ProfileConfig]:
     """List all profiles from the default storage."""
     return get_default_storage().list_profiles()
+
+
+def list_profile_summaries() -> List[ProfileSummary]:
+    """List lightweight profile summaries from the default storage."""
+    return get_default_storage().list_profile_summaries()
@@ -16,7 +16,9 @@ NÃO execute em ambientes expostos à internet.
 import argparse
 import os
 import sys
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Add pythonlib to path for imports
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -26,23 +28,32 @@ PYTHONLIB_DIR = REPO_ROOT / "pythonlib"
 if str(PYTHONLIB_DIR) not in sys.path:
     sys.path.insert(0, str(PYTHONLIB_DIR))
 
-try:
-    from camoufox import Camoufox
-    from camoufox.profile import ProfileConfig, ProfileStorage, load_profile
-except ImportError as e:
+# Heavy imports (camoufox pulls in Playwright) happen inside the functions
+# below, after argument parsing: --help and argument errors stay fast.
+if TYPE_CHECKING:
+    from camoufox.profile import ProfileConfig
+
+
+def _import_error(e: ImportError) -> None:
+    """Print the friendly dependency hint and exit."""
     print(f"Erro: Não foi possível importar camoufox. {e}")
     print("Certifique-se de que as dependências estão instaladas:")
     print("  cd pythonlib && pip install -e .")
     sys.exit(1)
 
 
-def launch_browser_with_profile(profile: ProfileConfig) -> None:
+def launch_browser_with_profile(profile: "ProfileConfig") -> None:
     """
     Launch Camoufox browser with the given profile configuration.
     
     Args:
         profile: The ProfileConfig to use for launching the browser.
     """
+    try:
+        from camoufox import Camoufox
+    except ImportError as e:
+        _import_error(e)
+
     # Convert profile to Camoufox config
     config = profile.to_camoufox_config()
     
@@ -87,19 +98,25 @@ def launch_browser_with_profile(profile: ProfileConfig) -> None:
         
         print("Navegador iniciado. Pressione Ctrl+C para fechar.")
         
-        # Keep the browser open until user closes it
+        # Keep the browser open until the user closes it. Instead of waking
+        # up every 30 seconds to poll, register a close/disconnect handler
+        # and block inside wait_for_event, which lets the sync dispatcher
+        # deliver the event the moment the browser goes away (a plain
+        # threading.Event().wait() would starve the dispatcher greenlet).
+        closed = threading.Event()
+        if use_persistent:
+            # In persistent context mode, browser is actually a BrowserContext
+            browser.on("close", lambda *_: closed.set())
+        else:
+            browser.on("disconnected", lambda *_: closed.set())
         try:
-            # Wait for browser to be closed by user
-            # Using a loop with short timeouts to allow for graceful shutdown
-            while True:
-                try:
-                    # Check if page is still connected every 30 seconds
-                    page.wait_for_timeout(30000)  # 30 seconds
-                except Exception:
-                    # Page/browser was closed
-                    break
+            if not closed.is_set():
+                page.wait_for_event("close", timeout=0)
         except KeyboardInterrupt:
             print("\nEncerrando navegador...")
+        except Exception:
+            # Page/browser was already closed
+            pass
 
 
 def main():
@@ -135,9 +152,14 @@ NOTA: Este script é para uso local apenas. Não exponha para a internet.
     )
     
     args = parser.parse_args()
-    
+
+    try:
+        from camoufox.profile import ProfileConfig, ProfileStorage
+    except ImportError as e:
+        _import_error(e)
+
     profile: ProfileConfig
-    
+
     if args.profile:
         # Load from specific file path
         profile_path = Path(args.profile)
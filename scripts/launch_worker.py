@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Long-lived Profile Launch Worker for Camoufox UI
+
+Reads profile IDs from stdin (one per line) and launches Camoufox for each,
+reusing a single ProfileStorage instance — and its in-memory profile cache —
+across launches. Unlike spawning launch_profile.py per launch, the Python
+startup, pythonlib imports and Playwright initialization are paid once per
+worker instead of once per browser.
+
+Usage:
+    python3 scripts/launch_worker.py [--profiles-dir DIR]
+
+The UI writes one profile ID per line to the worker's stdin; an empty line
+or EOF shuts the worker down. launch_profile.py remains available as the
+one-shot CLI alternative.
+
+SEGURANÇA: Este script é destinado APENAS para uso local.
+NÃO execute em ambientes expostos à internet.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add pythonlib to path for imports
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+PYTHONLIB_DIR = REPO_ROOT / "pythonlib"
+
+if str(PYTHONLIB_DIR) not in sys.path:
+    sys.path.insert(0, str(PYTHONLIB_DIR))
+
+try:
+    from camoufox.profile import ProfileStorage
+except ImportError as e:
+    print(f"Erro: Não foi possível importar camoufox. {e}")
+    print("Certifique-se de que as dependências estão instaladas:")
+    print("  cd pythonlib && pip install -e .")
+    sys.exit(1)
+
+from launch_profile import launch_browser_with_profile
+
+
+def serve(profiles_dir=None) -> None:
+    """
+    Serve launch requests from stdin until EOF or an empty line.
+
+    Args:
+        profiles_dir: Profiles directory for the shared ProfileStorage.
+    """
+    storage = ProfileStorage(profiles_dir) if profiles_dir else ProfileStorage()
+
+    print("Worker pronto. Envie IDs de perfil (um por linha); linha vazia encerra.")
+    sys.stdout.flush()
+
+    for line in sys.stdin:
+        profile_id = line.strip()
+        if not profile_id:
+            break
+
+        try:
+            profile = storage.load(profile_id)
+        except FileNotFoundError:
+            print(f"Erro: Perfil não encontrado: {profile_id}")
+            sys.stdout.flush()
+            continue
+
+        launch_browser_with_profile(profile)
+        sys.stdout.flush()
+
+    print("Encerrando worker.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Worker de longa duração para lançar perfis Camoufox.",
+        epilog="NOTA: Este script é para uso local apenas. Não exponha para a internet.",
+    )
+
+    parser.add_argument(
+        "--profiles-dir", "-d",
+        type=str,
+        default=None,
+        help="Diretório de perfis (padrão: profiles/ na raiz do repo)"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        serve(args.profiles_dir)
+    except KeyboardInterrupt:
+        print("\nEncerrando worker.")
+
+
+if __name__ == "__main__":
+    main()
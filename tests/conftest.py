@@ -34,6 +34,15 @@ from .server import Server, test_server
 
 _dirname = get_file_dirname()
 
+# Make the in-repo camoufox pythonlib importable without an installed package
+# or a PYTHONPATH tweak. Living here, the insert runs once per (xdist) worker
+# process instead of on every test-module import.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "pythonlib"))
+
+# Keep the suite hermetic: never read or write the user-level validation
+# result cache under the real ~/.cache/camoufox.
+os.environ.setdefault("CAMOUFOX_VALIDATION_DISK_CACHE", "0")
+
 
 """
 Patch playwright to not rely on module path for assets.
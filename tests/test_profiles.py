@@ -9,9 +9,7 @@ Or install camoufox package:
     pytest test_profiles.py -v
 """
 
-import tempfile
-from pathlib import Path
-
+import orjson
 import pytest
 
 from camoufox.profile import (
@@ -27,6 +25,7 @@ from camoufox.profile import (
 )
 from camoufox.presets import (
     AVAILABLE_PRESETS,
+    build_windows_screens,
     get_linux_desktop_preset,
     get_macos_apple_silicon_preset,
     get_preset,
@@ -37,12 +36,77 @@ from camoufox.presets import (
 )
 from camoufox.consistency import (
     ConsistencyLevel,
+    clear_validation_cache,
     enforce_os_consistency,
     get_consistency_summary,
     validate_profile,
+    validate_profiles_batch,
 )
 
 
+class InMemoryProfileStorage:
+    """
+    Dict-backed stand-in for ProfileStorage.
+
+    Runs profiles through the same orjson serialize/deserialize path as the
+    real storage but keeps the blobs in a dict, so unit tests that only care
+    about the round trip skip the per-profile disk syscalls. The filesystem
+    path stays covered by TestIntegration.test_preset_to_storage_roundtrip.
+    """
+
+    def __init__(self):
+        self._profiles = {}
+
+    def save(self, profile):
+        profile.touch()
+        self._profiles[profile.id] = orjson.dumps(
+            profile, option=orjson.OPT_SERIALIZE_DATACLASS
+        )
+
+    def save_many(self, profiles):
+        for profile in profiles:
+            self.save(profile)
+
+    def load(self, profile_id):
+        try:
+            blob = self._profiles[profile_id]
+        except KeyError:
+            raise FileNotFoundError(f"Profile not found: {profile_id}")
+        return ProfileConfig.from_dict(orjson.loads(blob))
+
+    def list_profiles(self):
+        return [
+            ProfileConfig.from_dict(orjson.loads(blob))
+            for blob in self._profiles.values()
+        ]
+
+    def delete(self, profile_id):
+        return self._profiles.pop(profile_id, None) is not None
+
+    def exists(self, profile_id):
+        return profile_id in self._profiles
+
+
+@pytest.fixture
+def memory_storage():
+    """In-memory storage fake for tests that don't need real disk I/O."""
+    return InMemoryProfileStorage()
+
+
+@pytest.fixture(scope="module")
+def storage_root(tmp_path_factory):
+    """One temp root shared by every filesystem-backed storage test."""
+    return tmp_path_factory.mktemp("profiles")
+
+
+@pytest.fixture
+def storage(storage_root, request):
+    """ProfileStorage bound to a per-test subdirectory of the shared root."""
+    profiles_dir = storage_root / request.node.name
+    profiles_dir.mkdir()
+    return ProfileStorage(str(profiles_dir))
+
+
 class TestProfileConfig:
     """Tests for ProfileConfig dataclass."""
 
@@ -163,45 +227,69 @@ class TestWebRTCConfig:
 class TestProfileStorage:
     """Tests for ProfileStorage."""
 
-    def test_save_and_load_profile(self):
+    def test_save_and_load_profile(self, memory_storage):
         """Test saving and loading a profile."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = ProfileStorage(tmpdir)
-            profile = ProfileConfig(name="Storage Test")
-            
-            storage.save(profile)
-            loaded = storage.load(profile.id)
-            
-            assert loaded.name == "Storage Test"
-            assert loaded.id == profile.id
-
-    def test_list_profiles(self):
+        profile = ProfileConfig(name="Storage Test")
+
+        memory_storage.save(profile)
+        loaded = memory_storage.load(profile.id)
+
+        assert loaded.name == "Storage Test"
+        assert loaded.id == profile.id
+
+    def test_list_profiles(self, memory_storage):
         """Test listing all profiles."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = ProfileStorage(tmpdir)
-            
-            # Create and save multiple profiles
-            profile1 = ProfileConfig(name="Profile 1")
-            profile2 = ProfileConfig(name="Profile 2")
-            storage.save(profile1)
-            storage.save(profile2)
-            
-            profiles = storage.list_profiles()
-            assert len(profiles) == 2
-            names = [p.name for p in profiles]
-            assert "Profile 1" in names
-            assert "Profile 2" in names
-
-    def test_delete_profile(self):
+        # Create and save multiple profiles in one batch
+        profile1 = ProfileConfig(name="Profile 1")
+        profile2 = ProfileConfig(name="Profile 2")
+        memory_storage.save_many([profile1, profile2])
+
+        profiles = memory_storage.list_profiles()
+        assert len(profiles) == 2
+        names = [p.name for p in profiles]
+        assert "Profile 1" in names
+        assert "Profile 2" in names
+
+    def test_iter_profiles_filters(self, storage):
+        """Test iter_profiles filtering on both the cold and cached paths."""
+        storage.save_many([
+            ProfileConfig(name="Work macOS", target_os="macos"),
+            ProfileConfig(name="Work Windows", target_os="windows"),
+            ProfileConfig(name="Personal Linux", target_os="linux"),
+        ])
+
+        # Cold path: filters run against the raw top-level JSON
+        assert {p.name for p in storage.iter_profiles(target_os="macos")} == {"Work macOS"}
+        assert {p.name for p in storage.iter_profiles(name_prefix="Work")} == {
+            "Work macOS",
+            "Work Windows",
+        }
+
+        # Warm the mtime cache, then filter against the cached dataclasses
+        storage.list_profiles()
+        assert {p.name for p in storage.iter_profiles(target_os="linux")} == {"Personal Linux"}
+        assert {p.name for p in storage.iter_profiles(name_prefix="Personal")} == {"Personal Linux"}
+        assert list(storage.iter_profiles(target_os="macos", name_prefix="Personal")) == []
+
+    def test_save_many(self, storage):
+        """Test batched saving through the real filesystem storage."""
+        profile1 = ProfileConfig(name="Batch 1")
+        profile2 = ProfileConfig(name="Batch 2")
+        storage.save_many([profile1, profile2])
+
+        # The batch shares a single timestamp
+        assert profile1.updated_at == profile2.updated_at
+        names = {p.name for p in storage.list_profiles()}
+        assert names == {"Batch 1", "Batch 2"}
+
+    def test_delete_profile(self, memory_storage):
         """Test deleting a profile."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = ProfileStorage(tmpdir)
-            profile = ProfileConfig(name="To Delete")
-            storage.save(profile)
-            
-            assert storage.exists(profile.id)
-            storage.delete(profile.id)
-            assert not storage.exists(profile.id)
+        profile = ProfileConfig(name="To Delete")
+        memory_storage.save(profile)
+
+        assert memory_storage.exists(profile.id)
+        memory_storage.delete(profile.id)
+        assert not memory_storage.exists(profile.id)
 
 
 class TestPresets:
@@ -214,13 +302,11 @@ class TestPresets:
         assert profile.navigator.platform == "MacIntel"
         assert "Mac OS X" in profile.navigator.oscpu
 
-    def test_get_macos_preset_retina_vs_standard(self):
+    @pytest.mark.parametrize("retina,expected_ratio", [(True, 2.0), (False, 1.0)])
+    def test_get_macos_preset_retina_vs_standard(self, retina, expected_ratio):
         """Test macOS preset with and without Retina."""
-        retina = get_macos_apple_silicon_preset(retina=True)
-        standard = get_macos_apple_silicon_preset(retina=False)
-        
-        assert retina.screen.device_pixel_ratio == 2.0
-        assert standard.screen.device_pixel_ratio == 1.0
+        profile = get_macos_apple_silicon_preset(retina=retina)
+        assert profile.screen.device_pixel_ratio == expected_ratio
 
     def test_get_windows_11_preset(self):
         """Test Windows 11 preset."""
@@ -229,15 +315,14 @@ class TestPresets:
         assert profile.navigator.platform == "Win32"
         assert "Windows NT" in profile.navigator.user_agent
 
-    def test_get_windows_11_preset_gpu_types(self):
+    @pytest.mark.parametrize(
+        "gpu_type,expected",
+        [("nvidia", "NVIDIA"), ("amd", "AMD"), ("intel", "Intel")],
+    )
+    def test_get_windows_11_preset_gpu_types(self, gpu_type, expected):
         """Test Windows 11 preset with different GPU types."""
-        nvidia = get_windows_11_preset(gpu_type="nvidia")
-        amd = get_windows_11_preset(gpu_type="amd")
-        intel = get_windows_11_preset(gpu_type="intel")
-        
-        assert "NVIDIA" in nvidia.webgl.renderer
-        assert "AMD" in amd.webgl.renderer
-        assert "Intel" in intel.webgl.renderer
+        profile = get_windows_11_preset(gpu_type=gpu_type)
+        assert expected in profile.webgl.renderer
 
     def test_get_linux_preset(self):
         """Test Linux desktop preset."""
@@ -258,15 +343,25 @@ class TestPresets:
             get_preset("invalid_preset_id")
         assert "Unknown preset" in str(exc_info.value)
 
-    def test_get_preset_for_os(self):
+    @pytest.mark.parametrize("os_name", ["macos", "windows", "linux"])
+    def test_get_preset_for_os(self, os_name):
         """Test getting default preset for each OS."""
-        macos = get_preset_for_os("macos")
-        windows = get_preset_for_os("windows")
-        linux = get_preset_for_os("linux")
-        
-        assert macos.target_os == "macos"
-        assert windows.target_os == "windows"
-        assert linux.target_os == "linux"
+        profile = get_preset_for_os(os_name)
+        assert profile.target_os == os_name
+
+    def test_build_windows_screens(self):
+        """Test bulk-building Windows screens for scaling factors."""
+        screens = build_windows_screens([1.0, 1.25, 1.5])
+
+        assert [s.device_pixel_ratio for s in screens] == [1.0, 1.25, 1.5]
+        # The common factors resolve to the shared flyweight constants
+        assert screens[0] is build_windows_screens([1.0])[0]
+        assert screens[1] is build_windows_screens([1.25])[0]
+        # Other factors get a freshly constructed config
+        assert screens[2] is not build_windows_screens([1.5])[0]
+        for screen in screens:
+            assert (screen.width, screen.height) == (1920, 1080)
+            assert screen.avail_height == 1040
 
     def test_list_presets(self):
         """Test listing all preset metadata."""
@@ -290,83 +385,67 @@ class TestConsistencyChecker:
         assert report.is_valid
         assert report.error_count == 0
 
-    def test_os_platform_mismatch(self):
-        """Test detection of OS/platform mismatch."""
-        profile = ProfileConfig(
-            name="Mismatch",
-            target_os="macos",
-            navigator=NavigatorConfig(platform="Win32"),  # Wrong!
-        )
-        report = validate_profile(profile)
-        
-        assert not report.is_valid
-        assert report.error_count > 0
-        assert any(i.code == "OS_PLATFORM_MISMATCH" for i in report.issues)
-
-    def test_os_oscpu_mismatch(self):
-        """Test detection of OS/oscpu mismatch."""
-        profile = ProfileConfig(
-            name="Mismatch",
-            target_os="macos",
-            navigator=NavigatorConfig(
-                platform="MacIntel",
-                oscpu="Windows NT 10.0",  # Wrong!
+    @pytest.mark.parametrize(
+        "kwargs,code",
+        [
+            pytest.param(
+                {"target_os": "macos", "navigator": NavigatorConfig(platform="Win32")},
+                "OS_PLATFORM_MISMATCH",
+                id="os-platform-mismatch",
             ),
-        )
-        report = validate_profile(profile)
-        
-        assert not report.is_valid
-        assert any(i.code == "OS_OSCPU_MISMATCH" for i in report.issues)
-
-    def test_webgl_os_mismatch(self):
-        """Test detection of WebGL/OS mismatch."""
-        profile = ProfileConfig(
-            name="Mismatch",
-            target_os="macos",
-            webgl=WebGLConfig(
-                enabled=True,
-                vendor="Google Inc. (NVIDIA)",
-                renderer="ANGLE (NVIDIA, Direct3D11)",  # Windows-style!
+            pytest.param(
+                {
+                    "target_os": "macos",
+                    "navigator": NavigatorConfig(
+                        platform="MacIntel",
+                        oscpu="Windows NT 10.0",
+                    ),
+                },
+                "OS_OSCPU_MISMATCH",
+                id="os-oscpu-mismatch",
             ),
-        )
-        report = validate_profile(profile)
-        
-        assert any(i.code == "WEBGL_OS_MISMATCH" for i in report.issues)
-
-    def test_webrtc_proxy_warning(self):
-        """Test warning for WebRTC with proxy but default mode."""
-        profile = ProfileConfig(
-            name="Proxy Issue",
-            proxy=ProxyConfig(type="http", server="http://proxy:8080"),
-            webrtc=WebRTCConfig(mode="default"),  # Should be disabled!
-        )
-        report = validate_profile(profile)
-        
-        assert any(i.code == "WEBRTC_PROXY_LEAK" for i in report.issues)
-
-    def test_macos_touch_warning(self):
-        """Test warning for touch points on macOS."""
-        profile = ProfileConfig(
-            name="Touch Issue",
-            target_os="macos",
-            navigator=NavigatorConfig(
-                platform="MacIntel",
-                max_touch_points=10,  # Unusual for Mac
+            pytest.param(
+                {
+                    "target_os": "macos",
+                    "webgl": WebGLConfig(
+                        enabled=True,
+                        vendor="Google Inc. (NVIDIA)",
+                        renderer="ANGLE (NVIDIA, Direct3D11)",  # Windows-style!
+                    ),
+                },
+                "WEBGL_OS_MISMATCH",
+                id="webgl-os-mismatch",
             ),
-        )
-        report = validate_profile(profile)
-        
-        assert any(i.code == "MACOS_TOUCH_UNUSUAL" for i in report.issues)
-
-    def test_invalid_core_count(self):
-        """Test error for invalid hardware concurrency."""
-        profile = ProfileConfig(
-            name="Invalid Cores",
-            navigator=NavigatorConfig(hardware_concurrency=0),
-        )
-        report = validate_profile(profile)
-        
-        assert any(i.code == "INVALID_CORE_COUNT" for i in report.issues)
+            pytest.param(
+                {
+                    "proxy": ProxyConfig(type="http", server="http://proxy:8080"),
+                    "webrtc": WebRTCConfig(mode="default"),  # Should be disabled!
+                },
+                "WEBRTC_PROXY_LEAK",
+                id="webrtc-proxy-leak",
+            ),
+            pytest.param(
+                {
+                    "target_os": "macos",
+                    "navigator": NavigatorConfig(
+                        platform="MacIntel",
+                        max_touch_points=10,  # Unusual for Mac
+                    ),
+                },
+                "MACOS_TOUCH_UNUSUAL",
+                id="macos-touch-unusual",
+            ),
+            pytest.param(
+                {"navigator": NavigatorConfig(hardware_concurrency=0)},
+                "INVALID_CORE_COUNT",
+                id="invalid-core-count",
+            ),
+        ],
+    )
+    def test_consistency_codes(self, kwargs, code):
+        """Test that each inconsistent profile surfaces its issue code."""
+        profile = ProfileConfig(name="Inconsistent", **kwargs)
+        assert code in validate_profile(profile).codes
 
     def test_enforce_os_consistency(self):
         """Test automatic OS consistency enforcement."""
@@ -396,6 +475,47 @@ class TestConsistencyChecker:
         assert "field_status" in summary
         assert "issues" in summary
 
+    @pytest.mark.parametrize("warm_cache", [False, True], ids=["uncached", "cached"])
+    def test_batch_validation_parity(self, warm_cache):
+        """Test that batch validation matches validate_profile per profile."""
+        profiles = [
+            get_macos_apple_silicon_preset(),  # valid
+            ProfileConfig(
+                name="Error Case",
+                target_os="macos",
+                navigator=NavigatorConfig(platform="Win32"),  # error
+            ),
+            ProfileConfig(
+                name="Warning Case",
+                target_os="macos",
+                navigator=NavigatorConfig(
+                    platform="MacIntel",
+                    max_touch_points=10,  # warning
+                ),
+            ),
+            ProfileConfig(
+                name="Info Case",
+                screen=ScreenConfig(color_depth=16),  # info
+            ),
+        ]
+        clear_validation_cache()
+        expected = [validate_profile(p) for p in profiles]
+        if not warm_cache:
+            clear_validation_cache()
+
+        reports = validate_profiles_batch(profiles)
+
+        assert [r.profile_id for r in reports] == [p.id for p in profiles]
+        for report, want in zip(reports, expected):
+            assert report.profile_name == want.profile_name
+            assert report.is_valid == want.is_valid
+            assert report.codes == want.codes
+            assert (report.error_count, report.warning_count, report.info_count) == (
+                want.error_count,
+                want.warning_count,
+                want.info_count,
+            )
+
     def test_report_human_readable(self):
         """Test human-readable report formatting."""
         profile = get_macos_apple_silicon_preset()
@@ -409,45 +529,35 @@ class TestConsistencyChecker:
 class TestIntegration:
     """Integration tests combining multiple components."""
 
-    def test_preset_to_storage_roundtrip(self):
+    def test_preset_to_storage_roundtrip(self, storage):
         """Test saving and loading a preset."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            storage = ProfileStorage(tmpdir)
-            
-            # Get a preset
-            original = get_preset("macos_apple_silicon")
-            original.name = "Integration Test"
-            
-            # Save and reload
-            storage.save(original)
-            loaded = storage.load(original.id)
-            
-            # Verify key properties preserved
-            assert loaded.name == "Integration Test"
-            assert loaded.target_os == "macos"
-            assert loaded.navigator.platform == "MacIntel"
-            assert loaded.screen.device_pixel_ratio == 2.0
-
-    def test_preset_validation(self):
+        # Get a preset
+        original = get_preset("macos_apple_silicon")
+        original.name = "Integration Test"
+
+        # Save and reload
+        storage.save(original)
+        loaded = storage.load(original.id)
+
+        # Verify key properties preserved
+        assert loaded.name == "Integration Test"
+        assert loaded.target_os == "macos"
+        assert loaded.navigator.platform == "MacIntel"
+        assert loaded.screen.device_pixel_ratio == 2.0
+
+    @pytest.mark.parametrize("preset_id", AVAILABLE_PRESETS)
+    def test_preset_validation(self, preset_id):
         """Test that all presets pass validation."""
-        for preset_id in AVAILABLE_PRESETS:
-            profile = get_preset(preset_id)
-            report = validate_profile(profile)
-            
-            assert report.is_valid, f"Preset {preset_id} failed validation: {report.format_human_readable()}"
+        report = validate_profile(get_preset(preset_id))
+        assert report.is_valid, f"Preset {preset_id} failed validation: {report.format_human_readable()}"
 
     def test_config_conversion_roundtrip(self):
         """Test profile to config and back."""
         original = get_preset("windows_11")
-        
-        # Convert to dict and back
+
+        # A single dict comparison covers every field instead of spot-checks
         data = original.to_dict()
-        restored = ProfileConfig.from_dict(data)
-        
-        # Verify key properties
-        assert restored.target_os == original.target_os
-        assert restored.navigator.platform == original.navigator.platform
-        assert restored.screen.width == original.screen.width
+        assert ProfileConfig.from_dict(data).to_dict() == data
 
 
 if __name__ == "__main__":